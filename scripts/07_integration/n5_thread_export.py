@@ -12,10 +12,11 @@ import os
 import sys
 import json
 import shutil
-import argparse
 from pathlib import Path
+from itertools import chain, islice
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import tempfile  # For atomic writes
 
 try:
@@ -24,6 +25,13 @@ except ImportError:
     print("ERROR: jsonschema not installed. Run: pip install jsonschema", file=sys.stderr)
     sys.exit(1)
 
+# Fast JSON serialization (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Timeline automation integration
 try:
     from timeline_automation import add_timeline_entry_from_aar
@@ -55,6 +63,15 @@ MAX_NEXT_STEPS_DISPLAY = 5
 MAX_FILES_IN_TREE = 10
 MAX_DECISIONS_DISPLAY = 5
 
+EXPORT_FILE_MODE = 0o600  # Mode of atomically written exports, whichever path writes them
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class ThreadExporter:
     """Handles AAR generation and thread export"""
@@ -68,6 +85,7 @@ class ThreadExporter:
         self.conversation_ws = CONVERSATION_WS_ROOT / thread_id
         self.aar_data = {}
         self.artifacts = []
+        self._summary_cache = None  # (aar_data, fields) during generate_modular_exports
         
         # Archive directory (new chronological naming convention)
         now = datetime.now()
@@ -167,25 +185,36 @@ class ThreadExporter:
     
     # ===== HELPER METHODS FOR MODULAR EXPORTS =====
     
+    def _get_summary_fields(self, aar_data: Dict) -> Tuple[str, str, List[str]]:
+        """Extract (purpose, outcome, constraints), read once per modular export call"""
+        cached = self._summary_cache
+        if cached is not None and cached[0] is aar_data:
+            return cached[1]
+        summary = aar_data.get('executive_summary', {})
+        return (
+            summary.get('purpose', 'Thread work'),
+            summary.get('outcome', 'Work completed'),
+            summary.get('constraints', [])
+        )
+    
     def _get_purpose(self, aar_data: Dict) -> str:
         """Extract purpose from AAR data"""
-        return aar_data.get('executive_summary', {}).get('purpose', 'Thread work')
+        return self._get_summary_fields(aar_data)[0]
     
     def _get_outcome(self, aar_data: Dict) -> str:
         """Extract outcome from AAR data"""
-        return aar_data.get('executive_summary', {}).get('outcome', 'Work completed')
+        return self._get_summary_fields(aar_data)[1]
     
     def _get_constraints(self, aar_data: Dict) -> List[str]:
         """Extract constraints from AAR data"""
-        return aar_data.get('executive_summary', {}).get('constraints', [])
+        return self._get_summary_fields(aar_data)[2]
     
     def _get_artifacts_by_type(self, artifacts: List[Dict]) -> Dict[str, List[Dict]]:
         """Group artifacts by type"""
-        by_type = {}
+        by_type = defaultdict(list)
         for artifact in artifacts:
-            atype = artifact.get('type', 'other')
-            by_type.setdefault(atype, []).append(artifact)
-        return by_type
+            by_type[artifact.get('type', 'other')].append(artifact)
+        return dict(by_type)
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable form"""
@@ -636,9 +665,7 @@ class ThreadExporter:
         size_kb = total_size / 1024
         
         # Group artifacts by type
-        by_type = {}
-        for a in self.artifacts:
-            by_type.setdefault(a['type'], []).append(a)
+        by_type = self._get_artifacts_by_type(self.artifacts)
         
         type_summary = ", ".join(f"{len(v)} {k}(s)" for k, v in by_type.items())
         
@@ -703,8 +730,7 @@ class ThreadExporter:
         self.archive_dir.mkdir(parents=True, exist_ok=True)
         
         if not self.dry_run:
-            with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
-                json.dump(self.aar_data, f, indent=2, ensure_ascii=False)
+            self.checkpoint_path.write_bytes(_json_bytes(self.aar_data))
         
         print(f"  {'[DRY-RUN]' if self.dry_run else '✓'} Saved checkpoint: {self.checkpoint_path.name}")
         return self.checkpoint_path
@@ -739,9 +765,8 @@ class ThreadExporter:
         if len(checkpoint['executive_summary']['purpose']) > len(current['executive_summary']['purpose']):
             current['executive_summary'] = checkpoint['executive_summary']
         
-        # Combine key events
-        all_events = checkpoint_events + current_events
-        current['key_events'] = all_events[:20]  # Limit to schema max
+        # Combine key events without materializing the full merged list
+        current['key_events'] = list(islice(chain(checkpoint_events, current_events), 20))  # Limit to schema max
         
         return current
     
@@ -749,15 +774,69 @@ class ThreadExporter:
     
     def generate_modular_exports(self, aar_data: Dict, next_thread_title: Optional[str] = None) -> Dict[str, str]:
         """Generate modular markdown exports (v2.2 - 5-phase aligned)"""
+        builders = self._modular_export_builders(aar_data, next_thread_title)
+        # Generators share one read of the summary fields; dropped afterwards so
+        # changes to aar_data between exports are always picked up
+        self._summary_cache = (aar_data, self._get_summary_fields(aar_data))
+        try:
+            return {filename: build() for filename, build in builders.items()}
+        finally:
+            self._summary_cache = None
+    
+    def _modular_export_builders(self, aar_data: Dict,
+                                 next_thread_title: Optional[str] = None) -> Dict[str, Callable[[], str]]:
+        """Modular export filenames in write order, each with the call that renders it"""
+        # RESUME and IMPLEMENTATION share one pass over the artifact buckets,
+        # made on first use (dry-runs only list the filenames)
+        sections: List[Tuple[List[str], List[str]]] = []
+        
+        def artifact_sections() -> Tuple[List[str], List[str]]:
+            if not sections:
+                sections.append(self._render_artifact_sections(
+                    aar_data.get('final_state', {}).get('artifacts', [])
+                ))
+            return sections[0]
+        
         return {
-            'INDEX.md': self._generate_index_md(aar_data),
-            'RESUME.md': self._generate_resume_md(aar_data, next_thread_title),
-            'DESIGN.md': self._generate_design_md(aar_data),
-            'IMPLEMENTATION.md': self._generate_implementation_md(aar_data),
-            'VALIDATION.md': self._generate_validation_md(aar_data),
-            'CONTEXT.md': self._generate_context_md(aar_data)
+            'INDEX.md': lambda: self._generate_index_md(aar_data),
+            'RESUME.md': lambda: self._generate_resume_md(aar_data, next_thread_title, artifact_sections()[0]),
+            'DESIGN.md': lambda: self._generate_design_md(aar_data),
+            'IMPLEMENTATION.md': lambda: self._generate_implementation_md(aar_data, artifact_sections()[1]),
+            'VALIDATION.md': lambda: self._generate_validation_md(aar_data),
+            'CONTEXT.md': lambda: self._generate_context_md(aar_data)
         }
     
+    def _render_artifact_sections(self, artifacts: List[Dict]) -> Tuple[List[str], List[str]]:
+        """Render RESUME (first types, 3 items each) and IMPLEMENTATION (all types, sorted) artifact blocks in one pass"""
+        resume_lines: List[str] = []
+        impl_blocks: Dict[str, List[str]] = {}
+        preview_limit = max(3, MAX_FILES_IN_TREE)
+        
+        for pos, (atype, items) in enumerate(self._get_artifacts_by_type(artifacts).items()):
+            label = atype.capitalize()
+            sizes = [self._format_file_size(item['size_bytes']) for item in items[:preview_limit]]
+            
+            if pos < MAX_PREVIEW_ARTIFACTS:
+                resume_lines.append(f"### {label} Files ({len(items)})")
+                for item, size in zip(items[:3], sizes):
+                    resume_lines.append(f"- `{item['filename']}` ({size})")
+                if len(items) > 3:
+                    resume_lines.append(f"  *(+{len(items) - 3} more)*")
+                resume_lines.append("")
+            
+            block = [f"### {label} Files\n"]
+            for item, size in zip(items[:MAX_FILES_IN_TREE], sizes):
+                block.append(f"- **`{item['filename']}`** ({size})")
+                if item.get('description'):
+                    block.append(f"  - {item['description']}")
+            if len(items) > MAX_FILES_IN_TREE:
+                block.append(f"  *(+{len(items) - MAX_FILES_IN_TREE} more files)*")
+            block.append("")
+            impl_blocks[atype] = block
+        
+        impl_lines = [line for atype in sorted(impl_blocks) for line in impl_blocks[atype]]
+        return resume_lines, impl_lines
+    
     def _generate_index_md(self, aar_data: Dict) -> str:
         """Generate INDEX.md - Navigation hub"""
         thread_id = self.thread_id
@@ -805,7 +884,8 @@ class ThreadExporter:
         
         return '\n'.join(md)
     
-    def _generate_resume_md(self, aar_data: Dict, next_thread_title: Optional[str] = None) -> str:
+    def _generate_resume_md(self, aar_data: Dict, next_thread_title: Optional[str] = None,
+                            artifact_lines: Optional[List[str]] = None) -> str:
         """Generate RESUME.md - Quick resume entry point"""
         thread_id = self.thread_id
         export_date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
@@ -834,15 +914,9 @@ class ThreadExporter:
         
         md.append("\n## What Was Completed\n")
         if artifacts:
-            by_type = self._get_artifacts_by_type(artifacts)
-            for atype, items in list(by_type.items())[:MAX_PREVIEW_ARTIFACTS]:
-                md.append(f"### {atype.capitalize()} Files ({len(items)})")
-                for item in items[:3]:
-                    size = self._format_file_size(item['size_bytes'])
-                    md.append(f"- `{item['filename']}` ({size})")
-                if len(items) > 3:
-                    md.append(f"  *(+{len(items) - 3} more)*")
-                md.append("")
+            if artifact_lines is None:
+                artifact_lines = self._render_artifact_sections(artifacts)[0]
+            md.extend(artifact_lines)
         
         md.append("\n## Next Steps\n")
         for idx, step in enumerate(next_steps[:MAX_NEXT_STEPS_DISPLAY], 1):
@@ -886,7 +960,7 @@ class ThreadExporter:
             md.append("")
         
         md.append("## Key Technical Decisions\n")
-        for idx, event in enumerate(key_events[:MAX_DECISIONS_DISPLAY], 1):
+        for idx, event in enumerate(islice(key_events, MAX_DECISIONS_DISPLAY), 1):
             event_type = event.get('type', 'decision').upper()
             md.append(f"### Decision {idx}: {event['description']}")
             md.append(f"**Type:** {event_type}\n")
@@ -900,7 +974,7 @@ class ThreadExporter:
         
         return '\n'.join(md)
     
-    def _generate_implementation_md(self, aar_data: Dict) -> str:
+    def _generate_implementation_md(self, aar_data: Dict, artifact_lines: Optional[List[str]] = None) -> str:
         """Generate IMPLEMENTATION.md - Technical details"""
         thread_id = self.thread_id
         export_date = datetime.now(timezone.utc).strftime('%Y-%m-%d')
@@ -918,18 +992,9 @@ class ThreadExporter:
         
         md.append("## File Structure\n")
         if artifacts:
-            by_type = self._get_artifacts_by_type(artifacts)
-            for atype in sorted(by_type.keys()):
-                items = by_type[atype]
-                md.append(f"### {atype.capitalize()} Files\n")
-                for item in items[:MAX_FILES_IN_TREE]:
-                    size = self._format_file_size(item['size_bytes'])
-                    md.append(f"- **`{item['filename']}`** ({size})")
-                    if item.get('description'):
-                        md.append(f"  - {item['description']}")
-                if len(items) > MAX_FILES_IN_TREE:
-                    md.append(f"  *(+{len(items) - MAX_FILES_IN_TREE} more files)*")
-                md.append("")
+            if artifact_lines is None:
+                artifact_lines = self._render_artifact_sections(artifacts)[1]
+            md.extend(artifact_lines)
         
         return '\n'.join(md)
     
@@ -987,33 +1052,56 @@ class ThreadExporter:
         
         return '\n'.join(md)
     
+    def _atomic_write(self, file_path: Path, content: str):
+        """Atomically publish file (O_TMPFILE + link on Linux, temp file + rename elsewhere)"""
+        data = content.encode('utf-8')
+        if hasattr(os, 'O_TMPFILE') and not file_path.exists():
+            try:
+                fd = os.open(str(file_path.parent), os.O_TMPFILE | os.O_WRONLY, EXPORT_FILE_MODE)
+            except OSError:
+                fd = None  # Filesystem without O_TMPFILE support
+            if fd is not None:
+                try:
+                    os.fchmod(fd, EXPORT_FILE_MODE)
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    os.link(f"/proc/self/fd/{fd}", str(file_path))
+                    return
+                except OSError:
+                    pass  # Fall through to the portable path
+                finally:
+                    os.close(fd)
+        
+        with tempfile.NamedTemporaryFile('wb', dir=file_path.parent, delete=False) as tmp:
+            os.fchmod(tmp.fileno(), EXPORT_FILE_MODE)
+            tmp.write(data)
+            tmp_path = Path(tmp.name)
+        tmp_path.rename(file_path)
+    
     def save_modular_aar(self, aar_data: Dict, next_thread_title: Optional[str] = None):
         """Save AAR in modular format (v2.2) with atomic writes"""
-        import tempfile
-        
         self.archive_dir.mkdir(parents=True, exist_ok=True)
         
         try:
             # Write JSON (source of truth)
             if not self.dry_run:
-                with open(self.aar_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(aar_data, f, indent=2, ensure_ascii=False)
+                self.aar_json_path.write_bytes(_json_bytes(aar_data))
             print(f"  {'[DRY-RUN]' if self.dry_run else '✓'} Saved JSON: {self.aar_json_path.name}")
             
+            # Dry-run: report files without building them
+            if self.dry_run:
+                for filename in self._modular_export_builders(aar_data):
+                    print(f"  [DRY-RUN] Saved: {filename}")
+                return
+            
             # Generate modular markdown files
             modular_exports = self.generate_modular_exports(aar_data)
             
             # Write markdown files atomically
             for filename, content in modular_exports.items():
-                file_path = self.archive_dir / filename
-                if not self.dry_run:
-                    with tempfile.NamedTemporaryFile('w', encoding='utf-8',
-                                                    dir=file_path.parent,
-                                                    delete=False) as tmp:
-                        tmp.write(content)
-                        tmp_path = Path(tmp.name)
-                    tmp_path.rename(file_path)
-                print(f"  {'[DRY-RUN]' if self.dry_run else '✓'} Saved: {filename}")
+                self._atomic_write(self.archive_dir / filename, content)
+                print(f"  ✓ Saved: {filename}")
         
         except IOError as e:
             print(f"  ❌ Error writing files: {e}")
@@ -1028,14 +1116,12 @@ class ThreadExporter:
         
         # Write JSON (source of truth)
         if not self.dry_run:
-            with open(self.aar_json_path, 'w', encoding='utf-8') as f:
-                json.dump(aar_data, f, indent=2, ensure_ascii=False)
+            self.aar_json_path.write_bytes(_json_bytes(aar_data))
         print(f"  {'[DRY-RUN]' if self.dry_run else '✓'} Saved JSON: {self.aar_json_path}")
         
         # Write Markdown (generated view)
         if not self.dry_run:
-            with open(self.aar_md_path, 'w', encoding='utf-8') as f:
-                f.write(markdown)
+            self.aar_md_path.write_bytes(markdown.encode('utf-8'))
         print(f"  {'[DRY-RUN]' if self.dry_run else '✓'} Saved Markdown: {self.aar_md_path}")
     
     def run(self, interactive=True, export_format='modular'):
@@ -1090,7 +1176,10 @@ class ThreadExporter:
         else:
             print("  ✓ AAR validated against schema")
         
-        markdown = self.generate_markdown(self.aar_data)
+        # Single-file markdown is only needed for the dry-run preview or the v2.0 format
+        markdown = None
+        if self.dry_run or export_format != 'modular':
+            markdown = self.generate_markdown(self.aar_data)
         
         # Preview
         print("\nPhase 4: Archive Structure")
@@ -1157,6 +1246,8 @@ class ThreadExporter:
 
 
 def main():
+    import argparse  # CLI-only; keeps module import cheap for programmatic use
+    
     parser = argparse.ArgumentParser(
         description="Generate After-Action Report (AAR) for conversation threads",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -1198,6 +1289,7 @@ def main():
     )
     
     args = parser.parse_args()
+    fallback_title = f"conversation-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
     
     # Determine thread ID
     thread_id = args.thread_id
@@ -1258,7 +1350,7 @@ def main():
             print(f"\n✓ Auto-selected title: {title}")
         else:
             # Fallback to default
-            title = f"conversation-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            title = fallback_title
             print(f"\n⚠️  No title options generated. Using: {title}")
     
     elif not title and not args.dry_run and not args.yes:
@@ -1269,7 +1361,7 @@ def main():
     
     elif not title and args.yes:
         # Generate default title for automated execution (ONLY if title generator unavailable)
-        title = f"conversation-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        title = fallback_title
     
     # Run export
     exporter = ThreadExporter(thread_id, title, args.dry_run)
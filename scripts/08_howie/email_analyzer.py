@@ -8,10 +8,14 @@ compounding understanding of relationships over time.
 Version: 1.0.0
 """
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
-from collections import defaultdict
+from email.utils import getaddresses
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from collections import Counter, defaultdict
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +24,19 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+# Gmail query limits
+MAX_RESULTS_PER_PERSON = 50
+MAX_RESULTS_PER_PAGE = 500  # Gmail's cap on maxResults
+# Addresses per OR-combined query, so a chunk's quota fits on one page
+QUERY_CHUNK_SIZE = MAX_RESULTS_PER_PAGE // MAX_RESULTS_PER_PERSON
+
+# Headers Gmail's from:/to: operators search (to: also covers cc and bcc)
+_ADDRESS_HEADERS = ('From', 'To', 'Cc', 'Bcc')
+MAX_FETCH_WORKERS = 10
+
+# Topic tokens: whitespace-split words stripped of these characters, 4+ long
+_TOPIC_STRIP = '[]():,.'
+
 
 class EmailAnalyzer:
     """Analyze email activity for weekly summaries"""
@@ -36,7 +53,8 @@ class EmailAnalyzer:
     def get_recent_emails_for_person(
         self, 
         email_address: str, 
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        after_date: Optional[str] = None
     ) -> List[Dict]:
         """
         Get email threads involving specific person in last N days
@@ -44,6 +62,7 @@ class EmailAnalyzer:
         Args:
             email_address: Email address to search for
             lookback_days: Days to look back (default: 30)
+            after_date: Precomputed Gmail 'after:' date (batch callers)
             
         Returns:
             List of email thread summaries
@@ -52,50 +71,54 @@ class EmailAnalyzer:
             log.warning("Gmail tool not available, returning empty results")
             return []
         
-        try:
-            # Calculate date range
-            end_date = datetime.now(timezone.utc)
-            start_date = end_date - timedelta(days=lookback_days)
-            
-            # Format for Gmail API
-            after_date = start_date.strftime('%Y/%m/%d')
+        threads = list(self.iter_recent_emails_for_person(email_address, lookback_days, after_date))
+        
+        if not threads:
+            log.info(f"No emails found for {email_address}")
+            return []
+        
+        log.info(f"Found {len(threads)} email threads for {email_address}")
+        return threads
+    
+    def iter_recent_emails_for_person(
+        self,
+        email_address: str,
+        lookback_days: int = 30,
+        after_date: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yield email thread summaries for a person, parsing messages lazily
+        
+        Streaming counterpart of get_recent_emails_for_person(); pair with
+        analyze_email_activity() to analyze without holding thread lists.
+        
+        Args:
+            email_address: Email address to search for
+            lookback_days: Days to look back (default: 30)
+            after_date: Precomputed Gmail 'after:' date (batch callers)
             
-            # Search query: from OR to this person, after date
-            query = f"(from:{email_address} OR to:{email_address}) after:{after_date}"
+        Yields:
+            Email thread summaries
+        """
+        if not self.gmail_tool:
+            log.warning("Gmail tool not available, returning empty results")
+            return
+        
+        try:
+            if after_date is None:
+                after_date = self._after_date(lookback_days)
             
             log.info(f"Searching Gmail for: {email_address} (last {lookback_days} days)")
             
-            # Use Gmail API tool
-            results = self.gmail_tool('gmail-find-email', {
-                'q': query,
-                'maxResults': 50,
-                'withTextPayload': True
-            })
-            
-            if not results or not results.get('messages'):
-                log.info(f"No emails found for {email_address}")
-                return []
-            
-            # Parse results
-            threads = []
-            for message in results.get('messages', []):
-                thread = {
-                    'id': message.get('id'),
-                    'thread_id': message.get('threadId'),
-                    'snippet': message.get('snippet', ''),
-                    'date': message.get('internalDate'),  # Unix timestamp ms
-                    'subject': self._extract_subject(message),
-                    'from': self._extract_sender(message),
-                    'to': self._extract_recipients(message)
-                }
-                threads.append(thread)
-            
-            log.info(f"Found {len(threads)} email threads for {email_address}")
-            return threads
+            # Search query: from OR to this person, after date
+            messages = self._search(
+                f"from:{email_address} OR to:{email_address}", after_date, MAX_RESULTS_PER_PERSON
+            )
             
+            for message in messages:
+                yield self._parse_message(message)
         except Exception as e:
             log.error(f"Error fetching emails for {email_address}: {e}")
-            return []
     
     def get_emails_for_multiple_people(
         self,
@@ -105,29 +128,116 @@ class EmailAnalyzer:
         """
         Get emails for multiple people
         
+        Issues one OR-combined Gmail query per chunk of addresses instead of
+        one query per person, then buckets messages by the addresses in their
+        From/To/Cc/Bcc headers. When that query fills its page, busy contacts
+        may have crowded out quieter ones, so anyone short of
+        MAX_RESULTS_PER_PERSON is re-queried alone.
+        
+        Args:
+            email_addresses: List of email addresses
+            lookback_days: Days to look back
+            
+        Returns:
+            Dict mapping email -> list of threads
+        """
+        if not self.gmail_tool:
+            log.warning("Gmail tool not available, returning empty results")
+            return {}
+        
+        after_date = self._after_date(lookback_days)
+        results = defaultdict(list)
+        unique_addresses = list(dict.fromkeys(email_addresses))
+        
+        for start in range(0, len(unique_addresses), QUERY_CHUNK_SIZE):
+            chunk = unique_addresses[start:start + QUERY_CHUNK_SIZE]
+            wanted = defaultdict(list)  # Lowercased address -> requested spellings
+            for email in chunk:
+                wanted[email.lower()].append(email)
+            clauses = " OR ".join(f"from:{a} OR to:{a}" for a in chunk)
+            max_results = MAX_RESULTS_PER_PERSON * len(chunk)
+            
+            log.info(f"Searching Gmail for {len(chunk)} people (last {lookback_days} days)")
+            
+            try:
+                messages = self._search(clauses, after_date, max_results)
+            except Exception as e:
+                log.error(f"Error fetching emails for {len(chunk)} people: {e}")
+                continue
+            
+            # Bucket each message under every requested address it involves
+            for message in messages:
+                thread = self._parse_message(message)
+                shared = False
+                for address in self._header_addresses(message) & wanted.keys():
+                    for email in wanted[address]:
+                        bucket = results[email]
+                        if len(bucket) < MAX_RESULTS_PER_PERSON:
+                            # Separate dict per person (identify_key_threads tags participant in place)
+                            bucket.append(dict(thread) if shared else thread)
+                            shared = True
+            
+            # A full page may be missing older mail of quieter contacts
+            if len(messages) >= max_results:
+                for email in chunk:
+                    if len(results.get(email, ())) < MAX_RESULTS_PER_PERSON:
+                        threads = list(
+                            self.iter_recent_emails_for_person(email, lookback_days, after_date)
+                        )
+                        if threads:  # A failed re-query keeps the bucketed threads
+                            results[email] = threads
+        
+        # Keep caller's address order
+        found = {email: results[email] for email in unique_addresses if results.get(email)}
+        log.info(f"Found email threads for {len(found)} of {len(unique_addresses)} people")
+        return found
+    
+    def get_emails_for_multiple_people_parallel(
+        self,
+        email_addresses: List[str],
+        lookback_days: int = 30,
+        max_workers: int = MAX_FETCH_WORKERS
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get emails for multiple people with concurrent per-person queries
+        
+        Fallback for Gmail tools that can't handle OR-combined queries;
+        lookups are I/O-bound, so threads overlap the network waits.
+        
         Args:
             email_addresses: List of email addresses
             lookback_days: Days to look back
+            max_workers: Maximum concurrent Gmail requests
             
         Returns:
             Dict mapping email -> list of threads
         """
-        results = {}
+        if not email_addresses:
+            return {}
         
-        for email in email_addresses:
-            threads = self.get_recent_emails_for_person(email, lookback_days)
-            if threads:
-                results[email] = threads
+        after_date = self._after_date(lookback_days)
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(email_addresses))) as pool:
+            futures = {
+                pool.submit(self.get_recent_emails_for_person, email, lookback_days, after_date): email
+                for email in email_addresses
+            }
+            for future in as_completed(futures):
+                fetched[futures[future]] = future.result()
         
-        return results
+        # Keep caller's address order
+        return {email: fetched[email] for email in email_addresses if fetched.get(email)}
     
     def analyze_email_activity(
         self,
-        email_threads: Dict[str, List[Dict]]
+        email_threads: Dict[str, Iterable[Dict]]
     ) -> Dict[str, Dict]:
         """
         Analyze email activity to summarize volume, topics, recency
         
+        Each person's threads are consumed in a single pass, so values may
+        be lists or generators from iter_recent_emails_for_person().
+        
         Args:
             email_threads: Dict mapping email -> threads
             
@@ -137,33 +247,37 @@ class EmailAnalyzer:
         analysis = {}
         
         for email, threads in email_threads.items():
-            if not threads:
-                continue
+            thread_count = 0
+            most_recent_ms = None  # Compare raw ms timestamps, convert once
+            recent_subjects = []
+            word_counts = Counter()
             
-            # Count threads and messages
-            thread_count = len(threads)
-            
-            # Get most recent date
-            most_recent = None
             for thread in threads:
+                thread_count += 1
+                
                 if thread.get('date'):
-                    # Convert Unix timestamp (ms) to datetime
-                    thread_date = datetime.fromtimestamp(
-                        int(thread['date']) / 1000,
-                        tz=timezone.utc
-                    )
-                    if not most_recent or thread_date > most_recent:
-                        most_recent = thread_date
+                    date_ms = int(thread['date'])
+                    if most_recent_ms is None or date_ms > most_recent_ms:
+                        most_recent_ms = date_ms
+                
+                subject = thread.get('subject')
+                if subject:
+                    if len(recent_subjects) < 3:
+                        recent_subjects.append(subject)
+                    self._count_topic_words(word_counts, subject)
             
-            # Extract topics from subjects
-            subjects = [t.get('subject', '') for t in threads if t.get('subject')]
-            topics = self._extract_topics(subjects)
+            if not thread_count:
+                continue
+            
+            most_recent = None
+            if most_recent_ms is not None:
+                most_recent = datetime.fromtimestamp(most_recent_ms / 1000, tz=timezone.utc)
             
             analysis[email] = {
                 'email_count': thread_count,
                 'last_contact': most_recent.strftime('%Y-%m-%d') if most_recent else 'Unknown',
-                'topics': topics[:5],  # Top 5 topics
-                'recent_subjects': subjects[:3]  # 3 most recent subjects
+                'topics': self._top_topics(word_counts)[:5],  # Top 5 topics
+                'recent_subjects': recent_subjects  # 3 most recent subjects
             }
         
         return analysis
@@ -191,15 +305,9 @@ class EmailAnalyzer:
                 thread['participant'] = email
                 all_threads.append(thread)
         
-        # Sort by date (most recent first)
-        all_threads.sort(
-            key=lambda t: int(t.get('date', 0)),
-            reverse=True
-        )
-        
-        # Take top N
+        # Take top N by date (most recent first) without sorting everything
         key_threads = []
-        for thread in all_threads[:top_n]:
+        for thread in heapq.nlargest(top_n, all_threads, key=lambda t: int(t.get('date', 0))):
             key_threads.append({
                 'participant': thread['participant'],
                 'subject': thread.get('subject', 'No subject'),
@@ -224,42 +332,68 @@ class EmailAnalyzer:
         Returns:
             List of (email, activity_data) tuples sorted by volume
         """
-        high_activity = []
-        
+        # (count, email, data) so the sort key is a plain tuple index
+        ranked = []
         for email, data in email_analysis.items():
-            if data.get('email_count', 0) >= threshold:
-                high_activity.append((email, data))
+            count = data.get('email_count', 0)
+            if count >= threshold:
+                ranked.append((count, email, data))
         
         # Sort by email count descending
-        high_activity.sort(key=lambda x: x[1]['email_count'], reverse=True)
+        ranked.sort(key=itemgetter(0), reverse=True)
         
-        return high_activity
+        return [(email, data) for _, email, data in ranked]
     
     # Helper methods
     
-    def _extract_subject(self, message: Dict) -> str:
-        """Extract subject from message"""
-        headers = message.get('payload', {}).get('headers', [])
-        for header in headers:
-            if header.get('name') == 'Subject':
-                return header.get('value', 'No subject')
-        return 'No subject'
+    def _header_addresses(self, message: Dict) -> Set[str]:
+        """Lowercased addresses named in a message's From/To/Cc/Bcc headers"""
+        values = [
+            header.get('value', '')
+            for header in message.get('payload', {}).get('headers', [])
+            if header.get('name') in _ADDRESS_HEADERS
+        ]
+        return {address.lower() for _, address in getaddresses(values) if address}
+    
+    def _after_date(self, lookback_days: int) -> str:
+        """Gmail 'after:' date for a lookback window"""
+        start_date = datetime.now(timezone.utc) - timedelta(days=lookback_days)
+        return start_date.strftime('%Y/%m/%d')
     
-    def _extract_sender(self, message: Dict) -> str:
-        """Extract sender from message"""
-        headers = message.get('payload', {}).get('headers', [])
-        for header in headers:
-            if header.get('name') == 'From':
-                return header.get('value', '')
-        return ''
+    def _search(self, query_suffix: str, after_date: str, max_results: int) -> List[Dict]:
+        """Run '(<query_suffix>) after:<date>' against Gmail, returning raw messages"""
+        # Metadata only: we read headers, snippet and internalDate, never bodies
+        results = self.gmail_tool('gmail-find-email', {
+            'q': f"({query_suffix}) after:{after_date}",
+            'maxResults': max_results,
+            'withTextPayload': False,
+            'metadataOnly': True
+        })
+        if not results:
+            return []
+        return results.get('messages') or []
     
-    def _extract_recipients(self, message: Dict) -> str:
-        """Extract recipients from message"""
-        headers = message.get('payload', {}).get('headers', [])
-        for header in headers:
-            if header.get('name') == 'To':
-                return header.get('value', '')
-        return ''
+    def _parse_message(self, message: Dict) -> Dict:
+        """Convert Gmail message to thread summary"""
+        headers = self._extract_headers(message)
+        return {
+            'id': message.get('id'),
+            'thread_id': message.get('threadId'),
+            'snippet': message.get('snippet', ''),
+            'date': message.get('internalDate'),  # Unix timestamp ms
+            'subject': headers.get('Subject', 'No subject'),
+            'from': headers.get('From', ''),
+            'to': headers.get('To', '')
+        }
+    
+    def _extract_headers(self, message: Dict) -> Dict[str, str]:
+        """Map header name -> value in one pass (first occurrence wins)"""
+        headers = {}
+        for header in message.get('payload', {}).get('headers', []):
+            name = header.get('name')
+            if name not in headers:
+                headers[name] = header.get('value', '')
+        return headers
     
     def _extract_topics(self, subjects: List[str]) -> List[str]:
         """
@@ -270,24 +404,20 @@ class EmailAnalyzer:
         if not subjects:
             return []
         
-        # Count word frequency (excluding common words)
-        stopwords = {'re', 'fwd', 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        word_counts = defaultdict(int)
-        
+        word_counts = Counter()
         for subject in subjects:
-            words = subject.lower().split()
-            for word in words:
-                word = word.strip('[]():,.')
-                if len(word) > 3 and word not in stopwords:
-                    word_counts[word] += 1
+            self._count_topic_words(word_counts, subject)
         
-        # Sort by frequency
-        sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # Return top topics (words appearing multiple times)
-        topics = [word for word, count in sorted_words if count > 1]
-        
-        return topics[:10]  # Top 10 topics
+        return self._top_topics(word_counts)
+    
+    def _count_topic_words(self, word_counts: Counter, subject: str):
+        """Add subject's words to running frequency count (short words are too common to be topics)"""
+        words = (word.strip(_TOPIC_STRIP) for word in subject.lower().split())
+        word_counts.update(word for word in words if len(word) > 3)
+    
+    def _top_topics(self, word_counts: Counter) -> List[str]:
+        """Top topics: words appearing multiple times"""
+        return [word for word, count in word_counts.most_common(10) if count > 1]  # Top 10 topics
 
 
 def main():
@@ -10,9 +10,11 @@ Separates:
 
 import re
 import sys
+import atexit
 from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from operator import attrgetter
 import logging
 from datetime import datetime, UTC
 
@@ -20,6 +22,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from content_library import ContentLibrary
 from b_block_parser import ResourceReference, EloquentLine
 
+logger = logging.getLogger(__name__)
+
 # Import Howie signature generator
 try:
     from howie_signature_generator import HowieSignatureGenerator, HowieTagSet
@@ -28,7 +32,17 @@ except ImportError:
     HOWIE_AVAILABLE = False
     logger.warning("Howie signature generator not available")
 
-logger = logging.getLogger(__name__)
+
+# Composers with an unsaved signature last_used update; flushed at exit in
+# case a caller never calls flush(). Held strongly so a composer dropped
+# without flushing still gets its update written.
+_UNFLUSHED_COMPOSERS = set()
+
+
+@atexit.register
+def _flush_composers():
+    for composer in list(_UNFLUSHED_COMPOSERS):
+        composer.flush()
 
 
 @dataclass
@@ -45,6 +59,15 @@ class EmailComposer:
     def __init__(self, voice_config: Optional[Dict] = None):
         self.content_library = ContentLibrary()
         self.voice_config = voice_config or {}
+        self._signature = None  # (snippet, content) once looked up
+        self._howie_generator = HowieSignatureGenerator() if HOWIE_AVAILABLE else None
+        self._pending_sig_upsert = None  # Signature awaiting last_used write (see flush)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.flush()
         
     def compose_email(
         self,
@@ -76,7 +99,7 @@ class EmailComposer:
         
         # 1. Opening
         opening = self._compose_opening(recipient_name, meeting_summary, eloquent_lines)
-        sections.append(EmailSection("Opening", [opening], priority=1))
+        sections.append(EmailSection("Opening", opening, priority=1))
         
         # 2. Key recap
         if key_decisions or eloquent_lines:
@@ -109,7 +132,7 @@ class EmailComposer:
             )
         
         signature = self._compose_signature(howie_tags=howie_tags)
-        sections.append(EmailSection("Signature", [signature], priority=10))
+        sections.append(EmailSection("Signature", signature, priority=10))
         
         # Assemble email
         return self._assemble_email(sections)
@@ -119,7 +142,7 @@ class EmailComposer:
         recipient_name: str,
         meeting_summary: str,
         eloquent_lines: List[EloquentLine]
-    ) -> str:
+    ) -> List[str]:
         """Compose opening with optional hook from eloquent line"""
         lines = [f"Hey {recipient_name},"]
         
@@ -133,7 +156,7 @@ class EmailComposer:
         
         lines.append(f"\n{meeting_summary}")
         
-        return "\n".join(lines)
+        return lines
     
     def _compose_recap(
         self,
@@ -159,9 +182,13 @@ class EmailComposer:
         """
         lines = ["\n**Resources we discussed:**\n"]
         
-        # Group by confidence
-        explicit = [r for r in resources if r.confidence == "explicit"]
-        implicit = [r for r in resources if r.confidence == "implicit"]
+        # Group by confidence (single pass; other confidences are dropped)
+        explicit, implicit = [], []
+        for r in resources:
+            if r.confidence == "explicit":
+                explicit.append(r)
+            elif r.confidence == "implicit":
+                implicit.append(r)
         
         # Add explicit resources first
         for res in explicit[:5]:  # Max 5
@@ -212,23 +239,17 @@ class EmailComposer:
         
         return lines
     
-    def _compose_signature(self, howie_tags: Optional['HowieTagSet'] = None) -> str:
+    def _compose_signature(self, howie_tags: Optional['HowieTagSet'] = None) -> List[str]:
         """Compose email signature from Content Library with optional Howie tags"""
-        # Search for signature snippet
-        signatures = self.content_library.search(
-            query=None,
-            tags={"purpose": ["signature"], "channel": ["email"]}
-        )
+        sig, content = self._get_signature()
         
         sig_parts = []
         
-        if signatures:
-            sig = signatures[0]
-            # Update last_used
+        if sig:
+            # Update last_used (persisted once by flush, not per email)
             sig.metadata["last_used"] = self._now_iso()
-            self.content_library.upsert(sig)
-            # Fix newline escaping
-            content = sig.content.replace("\\n", "\n")
+            self._pending_sig_upsert = sig
+            _UNFLUSHED_COMPOSERS.add(self)
             sig_parts.append(f"\n{content}")
         else:
             # Fallback
@@ -240,7 +261,29 @@ class EmailComposer:
             if tag_line:
                 sig_parts.append(f"\nHowie Tags: {tag_line}")
         
-        return "\n".join(sig_parts)
+        return sig_parts
+    
+    def flush(self):
+        """Persist pending signature last_used update (on leaving a with block, or at exit)"""
+        if self._pending_sig_upsert is not None:
+            sig, self._pending_sig_upsert = self._pending_sig_upsert, None
+            _UNFLUSHED_COMPOSERS.discard(self)
+            self.content_library.upsert(sig)
+    
+    def _get_signature(self):
+        """Signature snippet and its content, searched once per composer"""
+        if self._signature is None:
+            signatures = self.content_library.search(
+                query=None,
+                tags={"purpose": ["signature"], "channel": ["email"]}
+            )
+            if signatures:
+                sig = signatures[0]
+                # Fix newline escaping
+                self._signature = (sig, sig.content.replace("\\n", "\n"))
+            else:
+                self._signature = (None, None)
+        return self._signature
     
     def _generate_howie_tags(
         self,
@@ -269,12 +312,10 @@ class EmailComposer:
             logger.warning("Howie signature generator not available")
             return None
         
-        generator = HowieSignatureGenerator()
-        
         # Infer follow-up days if action items exist
         follow_up_days = 5 if has_action_items else None
         
-        tags = generator.generate(
+        tags = self._howie_generator.generate(
             context=context,  # not meeting_context
             recipient_type=recipient_type,
             urgency=urgency,
@@ -286,9 +327,9 @@ class EmailComposer:
         return tags
     
     def _assemble_email(self, sections: List[EmailSection]) -> str:
-        """Assemble final email from sections"""
+        """Assemble final email from sections (the only place lines are joined)"""
         # Sort by priority
-        sections.sort(key=lambda s: s.priority)
+        sections.sort(key=attrgetter('priority'))
         
         email_parts = []
         for section in sections:
@@ -304,7 +345,6 @@ class EmailComposer:
     
     def _now_iso(self) -> str:
         """Current timestamp in ISO format"""
-        from datetime import datetime
         return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S")
 
 
@@ -331,16 +371,16 @@ if __name__ == "__main__":
     eloquent_lines = [EloquentLine(**e) for e in blocks["eloquent_lines"]]
     
     # Compose email
-    composer = EmailComposer()
-    email = composer.compose_email(
-        recipient_name=args.recipient,
-        meeting_summary=args.summary,
-        resources_explicit=resources_explicit,
-        resources_suggested=resources_suggested,
-        eloquent_lines=eloquent_lines,
-        key_decisions=blocks["key_decisions"],
-        action_items=blocks["action_items"]
-    )
+    with EmailComposer() as composer:
+        email = composer.compose_email(
+            recipient_name=args.recipient,
+            meeting_summary=args.summary,
+            resources_explicit=resources_explicit,
+            resources_suggested=resources_suggested,
+            eloquent_lines=eloquent_lines,
+            key_decisions=blocks["key_decisions"],
+            action_items=blocks["action_items"]
+        )
     
     if args.output:
         with open(args.output, 'w') as f:
@@ -21,15 +21,34 @@ Date: 2025-10-22
 """
 
 import argparse
-import difflib
 import json
 import logging
+import mmap
+import os
 import re
 import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Final, Iterator, List, Optional, Tuple, Union, cast
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+
+# Compiled drop-in for difflib (same API and output), falls back to stdlib
+try:
+    import cydifflib as difflib  # type: ignore[import-untyped, import-not-found]
+except ImportError:
+    import difflib
+
+# Fast JSON serialization (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +58,118 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _cre(pattern: str, flags: int = re.I) -> re.Pattern:
+    """Compile a signal pattern once per process (not bounded by the re module cache)"""
+    return re.compile(pattern, flags)
+
+
+# Compiled signal patterns (literals kept lowercase: MASTER_LC_RE matches them case-sensitively)
+THIRD_PARTY_REFS = [
+    (_cre(r'(\w+) speaks highly of you'), 'third_party_reference'),
+    (_cre(r'(\w+) mentioned you'), 'third_party_reference'),
+    (_cre(r'i heard about you from (\w+)'), 'indirect_intro')
+]
+FORMALITY_INDICATORS = {
+    "formal": [_cre(p) for p in (r'\bpleasure\b', r'\bappreciate\b', r'\bthank you for your time\b')],
+    "casual": [_cre(p) for p in (r'\bloved\b', r'\bawesome\b', r'\bhey\b', r'\bgreat chatting\b')]
+}
+CORPORATE_PHRASES = [
+    (p, _cre(p))
+    for p in (r'moving forward', r'circle back', r'touch base', r'synerg(?:y|ize)', r'leverage', r'bandwidth')
+]
+MONEY_RE = _cre(r'\$\d+(?:,\d{3})*(?:\.\d{2})?(?:\s*/\s*(?:month|mo|year|yr))?')
+FREQ_STRIP_RE = _cre(r'\s*/\s*(?:month|mo|year|yr)')
+# Stripped content of each non-blank line, in one scan
+NONBLANK_LINE_RE = _cre(r'^[^\S\n]*(\S.*?)[^\S\n]*$', re.M)
+
+# All scanned signal patterns in one zero-width alternation, so each document is
+# scanned once: it stops wherever some pattern matches, and group grp_<i> (indexed
+# into SCAN_PATTERNS) names the first that does. Matches are bucketed by group name
+SCAN_PATTERNS = (
+    [p for p, _ in THIRD_PARTY_REFS]
+    + FORMALITY_INDICATORS["formal"]
+    + [p for _, p in CORPORATE_PHRASES]
+    + [MONEY_RE]
+)
+SCAN_GROUP = {p: f"grp_{i}" for i, p in enumerate(SCAN_PATTERNS)}
+SCAN_GROUP_NAMES = [SCAN_GROUP[p] for p in SCAN_PATTERNS]
+FORMAL_GROUPS = frozenset(SCAN_GROUP[p] for p in FORMALITY_INDICATORS["formal"])
+MASTER_PATTERN = '(?=' + '|'.join(f'(?P<{SCAN_GROUP[p]}>{p.pattern})' for p in SCAN_PATTERNS) + ')'
+MASTER_RE = _cre(MASTER_PATTERN)
+# Case-sensitive variants, run over pre-lowercased text
+MASTER_LC_RE = _cre(MASTER_PATTERN, 0)
+SCAN_LC_PATTERNS = [_cre(p.pattern, 0) for p in SCAN_PATTERNS]
+
+# Emails at least this large are memory-mapped instead of read
+MMAP_THRESHOLD: Final = 64 * 1024
+
+# Opt-in cache of comparison results keyed by file paths, reused while mtimes/sizes
+# are unchanged (signals only; diffs of email text are never stored)
+DEFAULT_CACHE_PATH: Final = Path.home() / ".cache" / "email_validator.json"
+CACHE_MAX_ENTRIES: Final = 256  # Oldest entries are dropped beyond this
+CACHE_VERSION: Final = 2  # Bump when analyzer output changes to drop stale results
+
+
+# Raw email contents: bytes, or a read-only mmap for large files
+EmailBuffer = Union[bytes, mmap.mmap]
+
+
+def _map_email(path: Path, stack: ExitStack) -> EmailBuffer:
+    """Email file contents as a buffer: mmap (closed by stack) for large files, bytes otherwise"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read()
+        return stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _decode_email(buf: EmailBuffer) -> str:
+    """Decode buffer like text-mode read (UTF-8, universal newlines)"""
+    return str(buf, 'utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _scan(text: str) -> Dict[str, List[str]]:
+    """
+    Single master-pattern pass over text: matched strings keyed by signal group,
+    the same matches each pattern's own finditer() would find (overlaps included)
+    """
+    hits: DefaultDict[str, List[str]] = defaultdict(list)
+    lowered = text.lower()
+    # Offsets only line up when lowercasing kept the length; otherwise match with re.I
+    if len(lowered) == len(text):
+        subject, master, patterns = lowered, MASTER_LC_RE, SCAN_LC_PATTERNS
+    else:
+        subject, master, patterns = text, MASTER_RE, SCAN_PATTERNS
+    ends = [0] * len(patterns)
+    for candidate in master.finditer(subject):
+        pos = candidate.start()
+        # Patterns before the first matching alternative can't match here; later
+        # ones might, so confirm each (unless still inside its previous match)
+        for i in range(int(cast(str, candidate.lastgroup)[4:]), len(patterns)):
+            if pos >= ends[i]:
+                m = patterns[i].match(subject, pos)
+                if m:
+                    # Slice the original so reported values keep their case
+                    hits[SCAN_GROUP_NAMES[i]].append(text[pos:m.end()])
+                    ends[i] = m.end()
+    return hits
+
+
+def _same_bytes(a: EmailBuffer, b: EmailBuffer) -> bool:
+    """Compare two buffers in C without copying them"""
+    if len(a) != len(b):
+        return False
+    with memoryview(a) as va, memoryview(b) as vb:
+        return va == vb
+
+
 @dataclass
 class ValidationSignal:
     """A learning signal from email comparison"""
@@ -57,33 +188,104 @@ class ValidationSignal:
 class EmailValidator:
     """Compare generated vs sent emails and extract learning signals"""
     
-    def __init__(self, meeting_folder: Path, knowledge_dir: Path):
+    def __init__(self, meeting_folder: Path, knowledge_dir: Path,
+                 cache_path: Optional[Path] = None):
         self.meeting_folder = Path(meeting_folder)
         self.knowledge_dir = Path(knowledge_dir)
+        self.cache_path = Path(cache_path) if cache_path else None
         self.signals: List[ValidationSignal] = []
+        # Reused for every line-pair similarity check
+        self._line_matcher = difflib.SequenceMatcher()
     
-    def compare_emails(self, generated_path: Path, sent_path: Path) -> Dict:
+    def compare_emails(self, generated_path: Path, sent_path: Path, include_diff: bool = True) -> Dict:
         """
         Compare generated draft vs sent email.
         Returns learning signals and validation status.
+        The unified diff is only built when include_diff is set (empty list otherwise).
         """
         logger.info(f"Comparing emails: {generated_path.name} vs {sent_path.name}")
         
-        with open(generated_path) as f:
-            generated = f.read()
-        with open(sent_path) as f:
-            sent = f.read()
+        # Cached results only stand in for a fresh comparison (no earlier signals)
+        cache_path = self.cache_path
+        if cache_path is None or self.signals:
+            return self._compare(generated_path, sent_path, include_diff)
+        
+        key = json.dumps([str(Path(generated_path).resolve()), str(Path(sent_path).resolve())])
+        stamps = [[st.st_mtime_ns, st.st_size] for st in map(os.stat, (generated_path, sent_path))]
+        cache = self._load_cache(cache_path)
+        entry = cache.get(key)
+        if entry and entry["stamps"] == stamps:
+            logger.info("✓ Inputs unchanged since last validation, reusing cached result")
+            result = entry["result"]
+            self.signals = [ValidationSignal(**s) for s in result["signals"]]
+            # The diff isn't cached; rebuild it from the files when asked for
+            result["diff"] = self._read_diff(generated_path, sent_path) if include_diff else []
+            return result
+        
+        result = self._compare(generated_path, sent_path, include_diff)
+        # Most recently used last, so the oldest entries are the ones dropped
+        cache.pop(key, None)
+        cache[key] = {"stamps": stamps, "result": {**result, "diff": []}}
+        while len(cache) > CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        self._save_cache(cache_path, cache)
+        return result
+    
+    def _read_diff(self, generated_path: Path, sent_path: Path) -> List[str]:
+        """Unified diff of the two email files"""
+        with ExitStack() as stack:
+            generated, sent = (_decode_email(_map_email(p, stack)) for p in (generated_path, sent_path))
+            return list(self._generate_diff(generated, sent))
+    
+    def _load_cache(self, cache_path: Path) -> Dict:
+        """Read the result cache entries (empty if missing, unreadable or from another version)"""
+        try:
+            data = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return cast(Dict, data.get("entries", {}))
+    
+    def _save_cache(self, cache_path: Path, cache: Dict) -> None:
+        """Write the result cache via temp file + rename; failures only cost the cache"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(_json_bytes({"version": CACHE_VERSION, "entries": cache}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write validation cache: {e}")
+    
+    def _compare(self, generated_path: Path, sent_path: Path, include_diff: bool) -> Dict:
+        """Read both emails and run all analyzers"""
+        with ExitStack() as stack:
+            # Independent reads: overlap the I/O waits
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                gen_buf, sent_buf = pool.map(lambda p: _map_email(p, stack), (generated_path, sent_path))
+            
+            # Identical files: nothing to learn, skip decoding and all analyzers
+            if _same_bytes(gen_buf, sent_buf):
+                return self._build_result([])
+            
+            generated = _decode_email(gen_buf)
+            sent = _decode_email(sent_buf)
+        
+        gen_hits = _scan(generated)
+        sent_hits = _scan(sent)
         
         # Extract structured differences
-        self._analyze_relationship_signals(generated, sent)
-        self._analyze_pricing_facts(generated, sent)
-        self._analyze_tone_formality(generated, sent)
+        self._analyze_relationship_signals(gen_hits, sent_hits)
+        self._analyze_pricing_facts(gen_hits, sent_hits)
+        self._analyze_tone_formality(gen_hits, sent_hits)
         self._analyze_factual_corrections(generated, sent)
         self._analyze_context_depth(generated, sent)
         
         # Generate diff for human review
-        diff = self._generate_diff(generated, sent)
-        
+        return self._build_result(list(self._generate_diff(generated, sent)) if include_diff else [])
+    
+    def _build_result(self, diff: List[str]) -> Dict:
+        """Assemble comparison result from accumulated signals"""
         # Determine if knowledge can be promoted
         critical_errors = [s for s in self.signals if s.impact == "critical"]
         validation_passed = len(critical_errors) == 0
@@ -96,19 +298,16 @@ class EmailValidator:
             "diff": diff
         }
     
-    def _analyze_relationship_signals(self, generated: str, sent: str):
+    def _analyze_relationship_signals(self, gen_hits: Dict[str, List[str]], sent_hits: Dict[str, List[str]]) -> None:
         """Detect relationship depth mismatches"""
         
         # Pattern: Third-party references when should be direct
-        third_party_refs = [
-            (r'(\w+) speaks highly of you', 'third_party_reference'),
-            (r'(\w+) mentioned you', 'third_party_reference'),
-            (r'I heard about you from (\w+)', 'indirect_intro')
-        ]
-        
-        for pattern, signal_type in third_party_refs:
-            if re.search(pattern, generated, re.I) and not re.search(pattern, sent, re.I):
-                match = re.search(pattern, generated, re.I)
+        for pattern, signal_type in THIRD_PARTY_REFS:
+            group = SCAN_GROUP[pattern]
+            gen_refs = gen_hits.get(group)
+            if gen_refs and group not in sent_hits:
+                # Re-match only the first matched reference (not the document) to pull out the name
+                match = pattern.match(gen_refs[0])
                 person = match.group(1) if match else "unknown"
                 
                 self.signals.append(ValidationSignal(
@@ -122,13 +321,8 @@ class EmailValidator:
                 ))
         
         # Pattern: Formal language when should be casual
-        formality_indicators = {
-            "formal": [r'\bpleasure\b', r'\bappreciate\b', r'\bthank you for your time\b'],
-            "casual": [r'\bloved\b', r'\bawesome\b', r'\bhey\b', r'\bgreat chatting\b']
-        }
-        
-        gen_formal = sum(1 for p in formality_indicators["formal"] if re.search(p, generated, re.I))
-        sent_formal = sum(1 for p in formality_indicators["formal"] if re.search(p, sent, re.I))
+        gen_formal = len(FORMAL_GROUPS.intersection(gen_hits))
+        sent_formal = len(FORMAL_GROUPS.intersection(sent_hits))
         
         if gen_formal > sent_formal + 2:
             self.signals.append(ValidationSignal(
@@ -141,19 +335,18 @@ class EmailValidator:
                 suggested_action="Update CRM: relationship_depth should be 'friend' not 'warm_contact'"
             ))
     
-    def _analyze_pricing_facts(self, generated: str, sent: str):
+    def _analyze_pricing_facts(self, gen_hits: Dict[str, List[str]], sent_hits: Dict[str, List[str]]) -> None:
         """Detect pricing/numeric errors"""
-        
-        # Extract all money amounts
-        gen_prices = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d{2})?(?:\s*/\s*(?:month|mo|year|yr))?', generated, re.I)
-        sent_prices = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d{2})?(?:\s*/\s*(?:month|mo|year|yr))?', sent, re.I)
+        money_group = SCAN_GROUP[MONEY_RE]
+        sent_prices = set(sent_hits.get(money_group, ()))
+        sent_bases = {FREQ_STRIP_RE.sub('', p) for p in sent_prices}
         
         # Check for mismatches
-        for gen_price in gen_prices:
-            if gen_price not in sent:
-                # Check if base amount exists without frequency
-                base_gen = re.sub(r'\s*/\s*(?:month|mo|year|yr)', '', gen_price, flags=re.I)
-                if base_gen in sent:
+        for gen_price in gen_hits.get(money_group, ()):
+            # Check if base amount exists without frequency
+            base_gen = FREQ_STRIP_RE.sub('', gen_price)
+            if base_gen != gen_price and gen_price not in sent_prices:
+                if base_gen in sent_bases:
                     self.signals.append(ValidationSignal(
                         category="pricing",
                         field="payment_frequency",
@@ -164,22 +357,14 @@ class EmailValidator:
                         suggested_action=f"Update meeting notes: pricing is {base_gen} ONE-TIME, not recurring"
                     ))
     
-    def _analyze_tone_formality(self, generated: str, sent: str):
+    def _analyze_tone_formality(self, gen_hits: Dict[str, List[str]], sent_hits: Dict[str, List[str]]) -> None:
         """Analyze tone shifts"""
         
         # Check for removed corporate speak
-        corporate_phrases = [
-            r'moving forward',
-            r'circle back',
-            r'touch base',
-            r'synerg(?:y|ize)',
-            r'leverage',
-            r'bandwidth'
-        ]
-        
         removed_corporate = []
-        for phrase in corporate_phrases:
-            if re.search(phrase, generated, re.I) and not re.search(phrase, sent, re.I):
+        for phrase, pattern in CORPORATE_PHRASES:
+            group = SCAN_GROUP[pattern]
+            if group in gen_hits and group not in sent_hits:
                 removed_corporate.append(phrase)
         
         if removed_corporate:
@@ -193,21 +378,26 @@ class EmailValidator:
                 suggested_action="Note: User prefers direct language, avoid corporate jargon"
             ))
     
-    def _analyze_factual_corrections(self, generated: str, sent: str):
+    def _analyze_factual_corrections(self, generated: str, sent: str) -> None:
         """Detect factual corrections"""
         
         # Simple heuristic: lines that changed significantly
-        gen_lines = [l.strip() for l in generated.split('\n') if l.strip()]
-        sent_lines = [l.strip() for l in sent.split('\n') if l.strip()]
+        gen_lines = NONBLANK_LINE_RE.findall(generated)
+        sent_lines = NONBLANK_LINE_RE.findall(sent)
+        
+        # Intern lines to small ints (packed arrays) so the line diff compares ints, not strings
+        line_ids: Dict[str, int] = {}
+        gen_ids = array('I', [line_ids.setdefault(l, len(line_ids)) for l in gen_lines])
+        sent_ids = array('I', [line_ids.setdefault(l, len(line_ids)) for l in sent_lines])
         
         # Use difflib to find modifications
-        matcher = difflib.SequenceMatcher(None, gen_lines, sent_lines)
+        matcher = difflib.SequenceMatcher(None, gen_ids, sent_ids)
         
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'replace':
                 for gen_line, sent_line in zip(gen_lines[i1:i2], sent_lines[j1:j2]):
                     # Only flag if substantial change (>30% different)
-                    if self._similarity(gen_line, sent_line) < 0.7:
+                    if self._is_dissimilar(gen_line, sent_line, 0.7):
                         self.signals.append(ValidationSignal(
                             category="fact",
                             field="content_accuracy",
@@ -218,7 +408,7 @@ class EmailValidator:
                             suggested_action="Review meeting notes for accuracy"
                         ))
     
-    def _analyze_context_depth(self, generated: str, sent: str):
+    def _analyze_context_depth(self, generated: str, sent: str) -> None:
         """Check if user added missing context"""
         
         # Check if sent is substantially longer (>20% more content)
@@ -236,24 +426,24 @@ class EmailValidator:
                 suggested_action="System missed context - review B-blocks for gaps"
             ))
     
-    def _similarity(self, a: str, b: str) -> float:
-        """Calculate similarity ratio between two strings"""
-        return difflib.SequenceMatcher(None, a, b).ratio()
+    def _is_dissimilar(self, a: str, b: str, threshold: float) -> bool:
+        """Whether similarity ratio is below threshold, using cheap upper bounds first"""
+        matcher = self._line_matcher
+        matcher.set_seqs(a, b)
+        # Upper bounds on ratio(): below threshold means the full match is unnecessary
+        return (matcher.real_quick_ratio() < threshold
+                or matcher.quick_ratio() < threshold
+                or matcher.ratio() < threshold)
     
-    def _generate_diff(self, generated: str, sent: str) -> List[str]:
-        """Generate human-readable diff"""
-        gen_lines = generated.split('\n')
-        sent_lines = sent.split('\n')
-        
-        diff = list(difflib.unified_diff(
-            gen_lines,
-            sent_lines,
+    def _generate_diff(self, generated: str, sent: str) -> Iterator[str]:
+        """Generate human-readable diff (lazily)"""
+        return difflib.unified_diff(
+            generated.split('\n'),
+            sent.split('\n'),
             fromfile='generated',
             tofile='sent',
             lineterm=''
-        ))
-        
-        return diff
+        )
     
     def apply_learnings(self, dry_run: bool = False) -> Dict:
         """
@@ -295,17 +485,17 @@ class EmailValidator:
             "knowledge_promotion_blocked": len(critical_signals) > 0
         }
     
-    def _update_crm_record(self, signal: ValidationSignal):
+    def _update_crm_record(self, signal: ValidationSignal) -> None:
         """Update CRM record based on signal"""
         # Find stakeholder CRM file
         # Update relationship_depth or formality_level
         logger.info(f"✓ CRM update: {signal.suggested_action}")
     
-    def _flag_meeting_notes(self, signal: ValidationSignal):
+    def _flag_meeting_notes(self, signal: ValidationSignal) -> None:
         """Flag meeting notes for correction"""
         logger.info(f"✓ Meeting flagged: {signal.suggested_action}")
     
-    def _log_preference(self, signal: ValidationSignal):
+    def _log_preference(self, signal: ValidationSignal) -> None:
         """Log user tone/style preference"""
         logger.info(f"✓ Preference logged: {signal.suggested_action}")
 
@@ -319,18 +509,23 @@ def main():
     parser.add_argument("--output", help="Output JSON file for learning signals")
     parser.add_argument("--apply", action="store_true", help="Apply learnings to CRM/notes")
     parser.add_argument("--dry-run", action="store_true", help="Dry run mode")
+    parser.add_argument("--cache", nargs="?", const=str(DEFAULT_CACHE_PATH), metavar="PATH",
+                        help=f"Reuse results for unchanged inputs from a cache file (default: {DEFAULT_CACHE_PATH})")
     
     args = parser.parse_args()
     
     validator = EmailValidator(
         Path(args.meeting_folder),
-        Path(args.knowledge_dir)
+        Path(args.knowledge_dir),
+        cache_path=Path(args.cache) if args.cache else None
     )
     
     # Compare emails
+    # The diff only appears in the saved report
     result = validator.compare_emails(
         Path(args.generated_email),
-        Path(args.sent_email)
+        Path(args.sent_email),
+        include_diff=bool(args.output)
     )
     
     # Print summary
@@ -357,8 +552,7 @@ def main():
     
     # Save output
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+        Path(args.output).write_bytes(_json_bytes(result))
         print(f"✓ Saved to: {args.output}")
     
     # Apply learnings if requested
@@ -11,10 +11,15 @@ import sys, json, re, argparse
 from pathlib import Path
 
 FORBIDDEN_PATTERNS = [r"```", r"\bEOF\b", r"\bwc -w\b", r"\bcat\s*>\b", r"^py(thon3?)?\b", r"count\s*=\s*len\("]
+FORBIDDEN_RES = [(pat, re.compile(pat, re.M)) for pat in FORBIDDEN_PATTERNS]
+FORBIDDEN_ANY_RE = re.compile("|".join(f"(?:{pat})" for pat in FORBIDDEN_PATTERNS), re.M)
 GREETING_RE = re.compile(r"^(Hi|Hey)\s+[A-Z][a-zA-Z\-']+,\s*$")
 SIGNOFF_START_RE = re.compile(r"^(Best,|Thanks,|Thank you,|Warmly,|Sincerely,)\s*$")
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 SUBJECT_RE = re.compile(r"^\*\*Subject:\*\*\s*(.+)$|^Subject:\s*(.+)$", re.I)
+DELIMITED_RE = re.compile(r"<<<EMAIL>>>\s*(.*?)\s*<<<END>>>", re.S)
+FENCE_OR_EOF_RE = re.compile(r"```|^EOF$")
+WORD_RE = re.compile(r"\b\w+\b")
 
 
 def read_text(p: str | None) -> str:
@@ -36,7 +41,7 @@ def try_json(text: str):
 
 
 def try_delimiters(text: str):
-    m = re.search(r"<<<EMAIL>>>\s*(.*?)\s*<<<END>>>", text, re.S)
+    m = DELIMITED_RE.search(text)
     if m:
         return None, m.group(1).strip()
     return None, None
@@ -44,47 +49,48 @@ def try_delimiters(text: str):
 
 def try_heuristic(text: str):
     lines = text.splitlines()
+    n = len(lines)
     subject = None
     # scan a subject line if present near the top
-    for i in range(min(15, len(lines))):
-        sm = SUBJECT_RE.search(lines[i])
+    for ln in lines[:15]:
+        sm = SUBJECT_RE.search(ln)
         if sm:
-            subject = next(g for g in sm.groups() if g) if sm else None
+            subject = next(g for g in sm.groups() if g)
             break
-    # find greeting
-    start = None
+    # single pass: find greeting, then the end of the first sign-off block after it,
+    # remembering the first fenced code or EOF marker as the fallback end
+    start = end = fence_end = None
     for i, ln in enumerate(lines):
-        if GREETING_RE.match(ln.strip()):
-            start = i
-            break
-    if start is None:
-        return subject, None
-    # find end: first empty line after a sign-off block containing V's signature or an email address
-    end = None
-    for j in range(start + 1, len(lines)):
-        if SIGNOFF_START_RE.match(lines[j].strip()):
+        if start is None:
+            if GREETING_RE.match(ln.strip()):
+                start = i
+            continue
+        # end: first empty line after a sign-off block containing V's signature or an email address
+        if SIGNOFF_START_RE.match(ln.strip()):
             # extend until we see an email or 6 lines ahead or blank after signature
-            for k in range(j, min(j + 12, len(lines))):
-                if EMAIL_RE.search(lines[k]) or lines[k].strip() == "" or k == len(lines) - 1:
+            for k in range(i, min(i + 12, n)):
+                if EMAIL_RE.search(lines[k]) or lines[k].strip() == "" or k == n - 1:
                     end = k
                     break
             if end is not None:
                 break
+        if fence_end is None and FENCE_OR_EOF_RE.search(ln):
+            fence_end = i - 1
+    if start is None:
+        return subject, None
     # fallback: stop before a fenced code or EOF marker
     if end is None:
-        for j in range(start + 1, len(lines)):
-            if re.search(r"```|^EOF$", lines[j]):
-                end = j - 1
-                break
-    if end is None:
-        end = len(lines) - 1
+        end = fence_end if fence_end is not None else n - 1
     body = "\n".join(lines[start : end + 1]).strip()
     return subject, body if body else None
 
 
 def has_forbidden(text: str) -> str | None:
-    for pat in FORBIDDEN_PATTERNS:
-        if re.search(pat, text, re.M):
+    # one pass for the common clean case; on a hit, report the first pattern in list order
+    if not FORBIDDEN_ANY_RE.search(text):
+        return None
+    for pat, rx in FORBIDDEN_RES:
+        if rx.search(text):
             return pat
     return None
 
@@ -108,7 +114,7 @@ def main():
         sys.exit(2)
 
     fb = has_forbidden(body)
-    wc = len(re.findall(r"\b\w+\b", body))
+    wc = sum(1 for _ in WORD_RE.finditer(body))
     if fb or wc < args.min_words:
         print(json.dumps({"ok": False, "error": "validation_failed", "forbidden": fb, "word_count": wc}))
         sys.exit(3)
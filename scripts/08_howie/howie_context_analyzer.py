@@ -12,14 +12,32 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import re
-from dataclasses import dataclass, asdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+# Optional C automaton for single-pass keyword counting (falls back to regex)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Fast JSON serialization (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)sZ %(levelname)s %(message)s",
@@ -28,6 +46,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+WORD_RE = re.compile(r"\w+")
+
+# "founders" qualifiers that mean someone else's founders, not ours
+EXTERNAL_FOUNDER_PHRASES = ("zo founders", "their founders", "the founders", "yc founders")
+
+# Reasoning text per inferred value (anything else gets the method's default)
+RECIPIENT_TYPE_EXPLANATIONS = {
+    "investor": "Detected investor-related language",
+    "hire": "Detected hiring/recruiting context",
+    "community": "Founder seeking help; community/ecosystem play",
+    "networking": "Networking/advisory conversation",
+}
+URGENCY_EXPLANATIONS = {
+    "urgent": "Explicit urgency signals detected",
+    "high": "Time-sensitive language detected",
+}
+RELATIONSHIP_EXPLANATIONS = {
+    "new": "First interaction; building relationship",
+    "established": "Established relationship",
+}
+VALUE_EXPLANATIONS = {
+    "strategic": "Strategic value - potential ecosystem/platform play (Zo customer)",
+    "high": "High value relationship",
+}
+ACCOMMODATION_EXPLANATIONS = {
+    2: "High accommodation due to {recipient_type} type and {value} value",
+    1: "Balanced accommodation - mutual convenience",
+}
+
+# analyze_blocks results by blocks-content hash (FIFO eviction)
+CONTEXT_CACHE_SIZE = 128
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON text, 2-space indented or compact (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as regex \\w for str patterns"""
+    return char.isalnum() or char == "_"
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is delimited as \\b...\\b would require"""
+    return (start == 0 or not _is_word_char(text[start - 1])) and (
+        end == len(text) or not _is_word_char(text[end])
+    )
+
+
 @dataclass
 class ConversationContext:
     """Analyzed context from conversation"""
@@ -44,87 +116,190 @@ class ConversationContext:
     reasoning: Dict[str, str]
 
 
+_context_cache: Dict[str, ConversationContext] = {}
+
+
+def _blocks_key(blocks_data: Dict[str, Any]) -> Optional[str]:
+    """Stable content hash of blocks data (None if not JSON-serializable)"""
+    try:
+        encoded = json.dumps(blocks_data, sort_keys=True).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+# Context fields generate_howie_tags() reads (its cache key)
+_tags_key = attrgetter(
+    "recipient_type", "priority", "accommodation_level", "urgency_level",
+    "requires_follow_up", "follow_up_days", "align_with_logan",
+)
+
+
 class HowieContextAnalyzer:
     """Analyzes conversation context to recommend Howie tags"""
     
     # Keyword signals for recipient type
-    INVESTOR_SIGNALS = [
+    INVESTOR_SIGNALS = (
         "investor", "funding", "raise", "round", "seed", "series",
         "vc", "venture", "capital", "investment", "valuation"
-    ]
+    )
     
-    HIRE_SIGNALS = [
+    HIRE_SIGNALS = (
         "hire", "hiring", "candidate", "interview", "role",
         "position", "job", "application", "resume", "technical co-founder search"
-    ]
+    )
     
     # Strategic founder partnerships (LD-FND)
-    FOUNDER_SIGNALS = [
+    FOUNDER_SIGNALS = (
         "founder partnership", "strategic founder", "co-founder", 
         "founder collaboration", "founder alliance", "startup founder",
         "product partnership", "founder-to-founder"
-    ]
+    )
     
     # Community organizations (LD-COM)
-    COMMUNITY_SIGNALS = [
+    COMMUNITY_SIGNALS = (
         "community org", "alumni association", "community group",
         "association", "fellowship", "cohort", "network group",
         "meetup", "future of higher ed", "mckinsey alumni"
-    ]
+    )
     
-    NETWORKING_SIGNALS = [
+    NETWORKING_SIGNALS = (
         "coffee", "chat", "connect", "intro", "introduction",
         "advice", "guidance", "mentorship", "feedback", "pick your brain"
-    ]
+    )
     
     # Urgency signals (maps to DX system)
-    URGENT_SIGNALS = [
+    URGENT_SIGNALS = (
         "urgent", "asap", "immediately", "emergency", "critical",
         "right away", "as soon as possible", "time-sensitive", "this week"
-    ]
+    )
     
-    HIGH_URGENCY_SIGNALS = [
+    HIGH_URGENCY_SIGNALS = (
         "soon", "quickly", "next few days", "pressing",
         "important", "priority", "by end of week"
-    ]
+    )
     
     # Value signals
-    HIGH_VALUE_SIGNALS = [
+    HIGH_VALUE_SIGNALS = (
         "strategic", "key", "important", "critical", "major",
         "significant", "large", "enterprise", "tier-1"
-    ]
+    )
     
-    STRATEGIC_VALUE_SIGNALS = [
+    STRATEGIC_VALUE_SIGNALS = (
         "partnership", "ecosystem", "platform", "integration",
         "long-term", "growth", "expansion"
-    ]
+    )
     
-    # Follow-up indicators
-    FOLLOW_UP_NEEDED = [
-        "follow up", "send", "share", "forward", "intro",
-        "connect", "action item", "next step", "will send"
-    ]
+    # Relationship stage signals
+    FIRST_TIME_SIGNALS = ("nice to meet", "thanks for taking the time", "heard about you")
+    ESTABLISHED_SIGNALS = ("as we discussed", "last time", "following up")
+    
+    # Built by _compile_signals(): signal -> dimensions it counts toward, split into
+    # single words (probed per token) and phrases (located with str.find)
+    SIGNAL_INDEX: Dict[str, List[str]] = {}
+    PHRASE_INDEX: Dict[str, List[str]] = {}
+    # Every signal -> (length, dimension names), when pyahocorasick is installed
+    _AUTOMATON = None
+    
+    @classmethod
+    def _signal_lists(cls) -> Dict[str, Tuple[str, ...]]:
+        """Signal lists keyed by the dimension name used in _count_signals"""
+        return {
+            "investor": cls.INVESTOR_SIGNALS,
+            "hire": cls.HIRE_SIGNALS,
+            "founder": cls.FOUNDER_SIGNALS,
+            "community": cls.COMMUNITY_SIGNALS,
+            "networking": cls.NETWORKING_SIGNALS,
+            "urgent": cls.URGENT_SIGNALS,
+            "high_urgency": cls.HIGH_URGENCY_SIGNALS,
+            "high_value": cls.HIGH_VALUE_SIGNALS,
+            "strategic_value": cls.STRATEGIC_VALUE_SIGNALS,
+            "first_time": cls.FIRST_TIME_SIGNALS,
+            "established": cls.ESTABLISHED_SIGNALS,
+        }
+    
+    @classmethod
+    def _compile_signals(cls) -> None:
+        """Index every signal by the dimensions it counts toward"""
+        for name, signals in cls._signal_lists().items():
+            for signal in signals:
+                index = cls.SIGNAL_INDEX if WORD_RE.fullmatch(signal) else cls.PHRASE_INDEX
+                index.setdefault(signal, []).append(name)
+        
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for name, signals in cls._signal_lists().items():
+                for signal in signals:
+                    # A keyword may feed several dimensions (e.g. "important")
+                    if signal in automaton:
+                        automaton.get(signal)[1].append(name)
+                    else:
+                        automaton.add_word(signal, (len(signal), [name]))
+            automaton.make_automaton()
+            cls._AUTOMATON = automaton
     
     def __init__(self):
         self.context = None
+        # (tag-relevant context fields, generate_howie_tags() result)
+        self._tags_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
     
     def analyze_blocks(self, blocks_data: Dict[str, Any]) -> ConversationContext:
-        """Analyze extracted B-blocks to infer context"""
+        """Analyze extracted B-blocks to infer context (memoized on blocks content)"""
+        
+        key = _blocks_key(blocks_data)
+        context = _context_cache.get(key) if key else None
+        if context is None:
+            context = self._analyze(blocks_data)
+            if key:
+                if len(_context_cache) >= CONTEXT_CACHE_SIZE:
+                    del _context_cache[next(iter(_context_cache))]
+                _context_cache[key] = context
+        if key:
+            # Callers get their own copy; the cached instance is never handed out
+            context = replace(context, reasoning=dict(context.reasoning))
+        
+        self.context = context
+        return context
+    
+    def analyze_many(
+        self, blocks_list: List[Dict[str, Any]], workers: Optional[int] = None
+    ) -> List[ConversationContext]:
+        """
+        Analyze many B-block sets, returning contexts in input order.
+        
+        With workers > 1 the sets are spread over a process pool (each worker builds
+        the signal tables once at import); otherwise they run here, sharing this
+        process's tables and context cache. self.context is left on the last set.
+        """
+        if workers and workers > 1 and len(blocks_list) > 1:
+            chunksize = max(1, len(blocks_list) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                contexts = list(pool.map(_analyze_one, blocks_list, chunksize=chunksize))
+            if contexts:
+                self.context = contexts[-1]
+            return contexts
+        
+        return [self.analyze_blocks(blocks_data) for blocks_data in blocks_list]
+    
+    def _analyze(self, blocks_data: Dict[str, Any]) -> ConversationContext:
+        """Run all inference passes over blocks data"""
         
         # Combine all text content for analysis
         all_text = self._extract_all_text(blocks_data)
         
+        counts = self._count_signals(all_text)
+        
         # Analyze different dimensions
-        recipient_type, recip_confidence = self._infer_recipient_type(all_text, blocks_data)
-        urgency, urgency_confidence = self._infer_urgency(all_text, blocks_data)
-        relationship, rel_confidence = self._infer_relationship_stage(all_text, blocks_data)
-        value_signal, value_confidence = self._infer_value_signal(all_text, blocks_data)
+        recipient_type, recip_confidence = self._infer_recipient_type(counts)
+        urgency, urgency_confidence = self._infer_urgency(counts, blocks_data)
+        relationship, rel_confidence = self._infer_relationship_stage(counts)
+        value_signal, value_confidence = self._infer_value_signal(counts)
         follow_up_needed, follow_up_days = self._check_follow_up(blocks_data)
         accommodation = self._infer_accommodation_level(
             recipient_type, relationship, value_signal
         )
-        align_logan = self._should_align_with_logan(all_text, recipient_type)
-        priority = self._infer_priority(recipient_type, value_signal, relationship)
+        align_logan = self._should_align_with_logan(all_text)
+        priority = self._infer_priority(recipient_type, value_signal)
         
         # Calculate overall confidence
         confidence = (
@@ -136,14 +311,14 @@ class HowieContextAnalyzer:
         
         # Build reasoning
         reasoning = {
-            "recipient_type": self._explain_recipient_type(all_text, recipient_type),
-            "urgency": self._explain_urgency(all_text, urgency),
-            "relationship": self._explain_relationship(all_text, relationship),
-            "value": self._explain_value(all_text, value_signal),
+            "recipient_type": self._explain_recipient_type(recipient_type),
+            "urgency": self._explain_urgency(urgency),
+            "relationship": self._explain_relationship(relationship),
+            "value": self._explain_value(value_signal),
             "accommodation": self._explain_accommodation(accommodation, recipient_type, value_signal)
         }
         
-        context = ConversationContext(
+        return ConversationContext(
             recipient_type=recipient_type,
             urgency_level=urgency,
             relationship_stage=relationship,
@@ -156,9 +331,6 @@ class HowieContextAnalyzer:
             confidence=confidence,
             reasoning=reasoning
         )
-        
-        self.context = context
-        return context
     
     def _extract_all_text(self, blocks_data: Dict[str, Any]) -> str:
         """Extract all text from blocks for analysis"""
@@ -184,35 +356,34 @@ class HowieContextAnalyzer:
         
         return " ".join(text_parts).lower()
     
-    def _infer_recipient_type(
-        self, text: str, blocks: Dict[str, Any]
-    ) -> tuple[str, float]:
+    def _infer_recipient_type(self, counts: Counter) -> tuple[str, float]:
         """Infer recipient type from content"""
         
         # Check in priority order - more specific patterns first
         scores = {
-            "investor": self._count_signals(text, self.INVESTOR_SIGNALS),
-            "hire": self._count_signals(text, self.HIRE_SIGNALS),
-            "founder": self._count_signals(text, self.FOUNDER_SIGNALS),  # Check founder first
-            "community": self._count_signals(text, self.COMMUNITY_SIGNALS),
-            "networking": self._count_signals(text, self.NETWORKING_SIGNALS),
+            "investor": counts["investor"],
+            "hire": counts["hire"],
+            "founder": counts["founder"],  # Check founder first
+            "community": counts["community"],
+            "networking": counts["networking"],
         }
         
-        if max(scores.values()) == 0:
+        # Single-pass argmax (ties go to the earlier type, as before)
+        best_type, best_score = max(scores.items(), key=itemgetter(1))
+        if best_score == 0:
             return "general", 0.3
         
-        best_type = max(scores, key=scores.get)
-        confidence = min(scores[best_type] / 5.0, 1.0)
+        confidence = min(best_score / 5.0, 1.0)
         
         return best_type, confidence
     
     def _infer_urgency(
-        self, text: str, blocks: Dict[str, Any]
+        self, counts: Counter, blocks: Dict[str, Any]
     ) -> tuple[str, float]:
         """Infer urgency level"""
         
-        urgent_count = self._count_signals(text, self.URGENT_SIGNALS)
-        high_count = self._count_signals(text, self.HIGH_URGENCY_SIGNALS)
+        urgent_count = counts["urgent"]
+        high_count = counts["high_urgency"]
         
         if urgent_count > 0:
             return "urgent", min(urgent_count / 2.0, 1.0)
@@ -223,18 +394,14 @@ class HowieContextAnalyzer:
         else:
             return "normal", 0.7
     
-    def _infer_relationship_stage(
-        self, text: str, blocks: Dict[str, Any]
-    ) -> tuple[str, float]:
+    def _infer_relationship_stage(self, counts: Counter) -> tuple[str, float]:
         """Infer relationship stage"""
         
         # Look for first-time meeting indicators
-        first_time_signals = ["nice to meet", "thanks for taking the time", "heard about you"]
-        first_time_count = self._count_signals(text, first_time_signals)
+        first_time_count = counts["first_time"]
         
         # Look for established relationship indicators
-        established_signals = ["as we discussed", "last time", "following up"]
-        established_count = self._count_signals(text, established_signals)
+        established_count = counts["established"]
         
         if first_time_count > 0:
             return "new", 0.8
@@ -243,13 +410,11 @@ class HowieContextAnalyzer:
         else:
             return "warm", 0.5
     
-    def _infer_value_signal(
-        self, text: str, blocks: Dict[str, Any]
-    ) -> tuple[str, float]:
+    def _infer_value_signal(self, counts: Counter) -> tuple[str, float]:
         """Infer strategic value"""
         
-        high_value_count = self._count_signals(text, self.HIGH_VALUE_SIGNALS)
-        strategic_count = self._count_signals(text, self.STRATEGIC_VALUE_SIGNALS)
+        high_value_count = counts["high_value"]
+        strategic_count = counts["strategic_value"]
         
         if strategic_count > 0:
             return "strategic", min((strategic_count + high_value_count) / 3.0, 1.0)
@@ -287,32 +452,20 @@ class HowieContextAnalyzer:
         
         return 1  # Default balanced
     
-    def _should_align_with_logan(self, text: str, recipient_type: str) -> bool:
+    def _should_align_with_logan(self, text: str) -> bool:
         """Check if meeting should align with Logan"""
         
-        # Explicit Logan mention
-        if "logan" in text:
-            return True
-        
-        # Check for "both of us" or "we should meet" (implies joint meeting)
-        if "both of us" in text or "we should meet" in text:
+        # Explicit Logan mention, or "both of us" / "we should meet" (implies joint meeting)
+        if "logan" in text or "both of us" in text or "we should meet" in text:
             return True
         
         # "founders" only if it's about OUR founders, not other companies
         # Negative signals: "zo founders", "their founders", "the founders"
-        if " founders" in text:
-            # Check if it's referring to external founders
-            external_founder_phrases = ["zo founders", "their founders", "the founders", "yc founders"]
-            if any(phrase in text for phrase in external_founder_phrases):
-                return False
-            # If just "founders" without qualifier, could be ours
-            return "founders" in text
-        
-        return False
-    
-    def _infer_priority(
-        self, recipient_type: str, value: str, relationship: str
-    ) -> str:
+        if " founders" not in text:
+            return False
+        return not any(phrase in text for phrase in EXTERNAL_FOUNDER_PHRASES)
+    
+    def _infer_priority(self, recipient_type: str, value: str) -> str:
         """Infer priority level (internal, founders, external)"""
         
         if value == "strategic" or recipient_type == "investor":
@@ -322,68 +475,57 @@ class HowieContextAnalyzer:
         else:
             return "external"  # Default to external for customer-facing
     
-    def _count_signals(self, text: str, signals: List[str]) -> int:
-        """Count occurrences of signal keywords"""
-        count = 0
-        for signal in signals:
-            count += len(re.findall(r'\b' + re.escape(signal) + r'\b', text))
-        return count
-    
-    def _explain_recipient_type(self, text: str, recipient_type: str) -> str:
+    def _count_signals(self, text: str) -> Counter:
+        """Count word-bounded signal occurrences per dimension"""
+        counts: Counter = Counter()
+        automaton = self._AUTOMATON
+        if automaton is None:
+            # A whole-word signal occurs exactly where a \w+ token equals it
+            signal_index = self.SIGNAL_INDEX
+            tokens = Counter(WORD_RE.findall(text))
+            # Key-view intersection runs in C; Python only loops over signals present
+            for token in tokens.keys() & signal_index.keys():
+                n = tokens[token]
+                for name in signal_index[token]:
+                    counts[name] += n
+            # Phrases: C-level substring search, boundary-checked only at actual hits;
+            # overlapping phrases (e.g. "mckinsey alumni" / "alumni association") each count
+            for phrase, names in self.PHRASE_INDEX.items():
+                start = text.find(phrase)
+                while start != -1:
+                    if _is_whole_word(text, start, start + len(phrase)):
+                        counts.update(names)
+                    start = text.find(phrase, start + 1)
+            return counts
+        
+        # Single automaton pass over all dimensions; keep only whole-word hits (as \b would)
+        for end, (length, names) in automaton.iter(text):
+            if _is_whole_word(text, end - length + 1, end + 1):
+                counts.update(names)
+        return counts
+    
+    def _explain_recipient_type(self, recipient_type: str) -> str:
         """Generate explanation for recipient type inference"""
-        
-        if recipient_type == "investor":
-            return "Detected investor-related language"
-        elif recipient_type == "hire":
-            return "Detected hiring/recruiting context"
-        elif recipient_type == "community":
-            return "Founder seeking help; community/ecosystem play"
-        elif recipient_type == "networking":
-            return "Networking/advisory conversation"
-        else:
-            return "General meeting context"
+        return RECIPIENT_TYPE_EXPLANATIONS.get(recipient_type, "General meeting context")
     
-    def _explain_urgency(self, text: str, urgency: str) -> str:
+    def _explain_urgency(self, urgency: str) -> str:
         """Generate explanation for urgency inference"""
-        
-        if urgency == "urgent":
-            return "Explicit urgency signals detected"
-        elif urgency == "high":
-            return "Time-sensitive language detected"
-        else:
-            return "Standard follow-up timeline"
+        return URGENCY_EXPLANATIONS.get(urgency, "Standard follow-up timeline")
     
-    def _explain_relationship(self, text: str, relationship: str) -> str:
+    def _explain_relationship(self, relationship: str) -> str:
         """Generate explanation for relationship stage"""
-        
-        if relationship == "new":
-            return "First interaction; building relationship"
-        elif relationship == "established":
-            return "Established relationship"
-        else:
-            return "Warming relationship"
+        return RELATIONSHIP_EXPLANATIONS.get(relationship, "Warming relationship")
     
-    def _explain_value(self, text: str, value: str) -> str:
+    def _explain_value(self, value: str) -> str:
         """Generate explanation for value signal"""
-        
-        if value == "strategic":
-            return "Strategic value - potential ecosystem/platform play (Zo customer)"
-        elif value == "high":
-            return "High value relationship"
-        else:
-            return "Standard value"
+        return VALUE_EXPLANATIONS.get(value, "Standard value")
     
     def _explain_accommodation(
         self, accommodation: int, recipient_type: str, value: str
     ) -> str:
         """Generate explanation for accommodation level"""
-        
-        if accommodation == 2:
-            return f"High accommodation due to {recipient_type} type and {value} value"
-        elif accommodation == 1:
-            return "Balanced accommodation - mutual convenience"
-        else:
-            return "Minimal accommodation - our terms"
+        template = ACCOMMODATION_EXPLANATIONS.get(accommodation, "Minimal accommodation - our terms")
+        return template.format(recipient_type=recipient_type, value=value)
     
     def generate_howie_tags(self) -> str:
         """Generate Howie tag string from analyzed context"""
@@ -391,6 +533,10 @@ class HowieContextAnalyzer:
         if not self.context:
             raise ValueError("Must run analyze_blocks() first")
         
+        key = _tags_key(self.context)
+        if self._tags_cache is not None and self._tags_cache[0] == key:
+            return self._tags_cache[1]
+        
         # Build tag components
         tags = []
         
@@ -437,7 +583,9 @@ class HowieContextAnalyzer:
         # Activation symbol
         tags.append("*")
         
-        return " ".join(f"[{tag}]" if tag != "*" else tag for tag in tags)
+        howie_tags = " ".join(f"[{tag}]" if tag != "*" else tag for tag in tags)
+        self._tags_cache = (key, howie_tags)
+        return howie_tags
     
     def generate_full_signature(self) -> str:
         """Generate complete signature with Howie tags"""
@@ -463,8 +611,12 @@ class HowieContextAnalyzer:
         if not self.context:
             raise ValueError("Must run analyze_blocks() first")
         
+        # Shallow copy; reasoning is the only mutable field
+        analysis = dict(vars(self.context))
+        analysis["reasoning"] = dict(analysis["reasoning"])
+        
         return {
-            "analysis": asdict(self.context),
+            "analysis": analysis,
             "recommended_tags": self.generate_howie_tags(),
             "full_signature": self.generate_full_signature(),
             "confidence_level": f"{self.context.confidence:.0%}",
@@ -472,6 +624,14 @@ class HowieContextAnalyzer:
         }
 
 
+HowieContextAnalyzer._compile_signals()
+
+
+def _analyze_one(blocks_data: Dict[str, Any]) -> ConversationContext:
+    """Process-pool entry point for analyze_many"""
+    return HowieContextAnalyzer().analyze_blocks(blocks_data)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Analyze conversation context and generate Howie tags"
@@ -479,7 +639,9 @@ def main() -> int:
     parser.add_argument(
         "--blocks",
         required=True,
-        help="Path to blocks JSON file"
+        nargs="+",
+        help="Path to blocks JSON file (several files are analyzed in one run; "
+             "with --output-format json they print as JSON Lines)"
     )
     parser.add_argument(
         "--transcript",
@@ -498,24 +660,38 @@ def main() -> int:
     )
     
     args = parser.parse_args()
+    batch = len(args.blocks) > 1
     
-    # Load blocks
-    try:
-        with open(args.blocks) as f:
-            blocks_data = json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load blocks: {e}")
-        return 1
-    
-    # Analyze
+    # One analyzer for every input: signal tables and context cache are shared
     analyzer = HowieContextAnalyzer()
-    context = analyzer.analyze_blocks(blocks_data)
-    
-    # Output
-    if args.output_format == "json":
-        report = analyzer.generate_analysis_report()
-        print(json.dumps(report, indent=2))
-    else:
+    status = 0
+    
+    for i, blocks_path in enumerate(args.blocks):
+        # Load blocks
+        try:
+            with open(blocks_path) as f:
+                blocks_data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load blocks {blocks_path}: {e}")
+            status = 1
+            continue
+        
+        # Analyze
+        context = analyzer.analyze_blocks(blocks_data)
+        
+        # Output
+        if args.output_format == "json":
+            report = analyzer.generate_analysis_report()
+            if batch:
+                # JSON Lines: one compact report per blocks file
+                report["blocks_file"] = blocks_path
+            print(_json_dumps(report, indent=not batch))
+            continue
+        
+        if batch:
+            if i:
+                print()
+            print(f"=== {blocks_path} ===")
         if args.full_signature:
             print(analyzer.generate_full_signature())
         else:
@@ -534,8 +710,7 @@ def main() -> int:
             print()
         print(f"Confidence: {context.confidence:.0%}")
     
-    return 0
-
+    return status
 
 if __name__ == "__main__":
     exit(main())
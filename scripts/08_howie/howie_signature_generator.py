@@ -8,14 +8,30 @@ Generates V-OS tags for email signatures that provide coded instructions to Howi
 Usage:
     python3 howie_signature_generator.py --context "investor meeting" --urgency high
     python3 howie_signature_generator.py --recipient-type investor --priority external --follow-up-days 5
+    python3 howie_signature_generator.py --batch contexts.jsonl --json
 """
 
 import argparse
 import json
 import logging
+import re
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Final, Iterable, List, Optional, Set, Tuple, cast
+
+# Optional C automaton for single-pass pattern matching (falls back to regex)
+try:
+    import ahocorasick  # type: ignore[import-not-found]  # untyped C extension
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Fast JSON serialization (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,131 +39,146 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Human-readable meaning per tag (used by HowieTagSet.get_explanation)
+LEAD_MEANINGS = {
+    "LD-FND": "Founder (strategic)",
+    "LD-INV": "Investor",
+    "LD-HIR": "Hiring / candidate",
+    "LD-COM": "Community organization",
+    "LD-NET": "Networking contact",
+    "LD-GEN": "General lead"
+}
+PRIORITY_MEANINGS = {
+    "GPT-I": "Prioritize internal constraints",
+    "GPT-E": "Prioritize external constraints",
+    "GPT-F": "Prioritize founders' (Vrijen + Logan) constraints"
+}
+ACCOMMODATION_MEANINGS = {
+    "A-0": "Only on our terms",
+    "A-1": "Baseline accommodation",
+    "A-2": "Fully accommodating"
+}
+SCHEDULING_MEANINGS = {
+    "LOG": "Align with Logan's availability",
+    "ILS": "Align with Ilse's availability",
+}
+SPECIAL_MEANINGS = {
+    "FLX": "Event can shift within same day",
+    "WEX": "Allow weekend extension if needed",
+    "WEP": "Prefer weekend scheduling",
+    "TERM": "Terminate Howie's involvement for this thread",
+    "INC": "Ignore email entirely"
+}
+
+# Scheduling window tags: D<days> with optional +/- (at least / at most)
+_SCHED_RX = re.compile(r"D(\d+)([+-]?)")
+_SCHED_EXPLAIN = {
+    "+": "Schedule {days}+ business days out (≥ {days} days)",
+    "-": "Schedule by {days} business days at latest (≤ {days} days)",
+    "": "Schedule in exactly {days} business days",
+}
+
+# Timeline tags generate() emits (see HowieSignatureGenerator.URGENCY_MAPPING)
+TIMELINE_TAGS = ("D1-", "D3-", "D3+", "D7+")
 
-@dataclass
+# Shared "[TAG]" strings for the fixed tag vocabulary (F-N tags are built per call)
+_BRACKETED = {
+    tag: f"[{tag}]"
+    for tags in (
+        LEAD_MEANINGS, PRIORITY_MEANINGS, ACCOMMODATION_MEANINGS,
+        SCHEDULING_MEANINGS, SPECIAL_MEANINGS, TIMELINE_TAGS
+    )
+    for tag in tags
+}
+
+
+@dataclass(slots=True)
 class HowieTagSet:
     """A set of Howie V-OS tags with their reasoning"""
     lead_type: Optional[str] = None  # LD-INV, LD-HIR, LD-COM, LD-NET, LD-GEN
-    scheduling: list[str] = field(default_factory=list)  # LOG, ILS, D3+, D1-, etc.
+    scheduling: tuple[str, ...] = ()  # LOG, ILS, D3+, D1-, etc.
     priority: Optional[str] = None  # GPT-I, GPT-E, GPT-F
     accommodation: Optional[str] = None  # A-0, A-1, A-2
-    follow_up: list[str] = field(default_factory=list)  # F-X
-    special: list[str] = field(default_factory=list)  # WEX, WEP, TERM, INC, FLX
+    follow_up: tuple[str, ...] = ()  # F-X
+    special: tuple[str, ...] = ()  # WEX, WEP, TERM, INC, FLX
     activated: bool = True  # Whether to add * (activation symbol)
+    # get_explanation() result, computed on first call and dropped when a tag field is set
+    _explanation: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_explanation":
+            object.__setattr__(self, "_explanation", None)
     
     def to_signature_line(self) -> str:
         """Generate the Howie tags signature line"""
-        tags = []
-        
-        # Lead type first
-        if self.lead_type:
-            tags.append(f"[{self.lead_type}]")
-        
-        # Priority
-        if self.priority:
-            tags.append(f"[{self.priority}]")
-        
-        # Accommodation level
-        if self.accommodation:
-            tags.append(f"[{self.accommodation}]")
-        
-        # Scheduling constraints
-        tags.extend([f"[{t}]" for t in self.scheduling])
-        
-        # Follow-up rules
-        tags.extend([f"[{t}]" for t in self.follow_up])
-        
-        # Special modifiers
-        tags.extend([f"[{t}]" for t in self.special])
+        if not (
+            self.lead_type or self.priority or self.accommodation
+            or self.scheduling or self.follow_up or self.special
+        ):
+            return ""
+        
+        # Lead type, priority and accommodation level first, then scheduling
+        # constraints, follow-up rules and special modifiers
+        bracketed = _BRACKETED.get
+        tags = [
+            bracketed(tag) or f"[{tag}]"
+            for tag in (
+                *filter(None, (self.lead_type, self.priority, self.accommodation)),
+                *self.scheduling,
+                *self.follow_up,
+                *self.special,
+            )
+        ]
         
         # Add activation marker if needed
         signature = " ".join(tags)
-        if self.activated and tags:
-            signature += " *"
-        
-        return signature
+        return signature + " *" if self.activated else signature
     
-    def get_explanation(self) -> dict:
-        """Get human-readable explanation of each tag"""
-        explanations = {}
+    def get_explanation(self) -> Dict[str, str]:
+        """Get human-readable explanation of each tag (cached until a tag field changes)"""
+        if self._explanation is not None:
+            return dict(self._explanation)
+        
+        explanations: Dict[str, str] = {}
         
         if self.lead_type:
-            lead_meanings = {
-                "LD-FND": "Founder (strategic)",
-                "LD-INV": "Investor",
-                "LD-HIR": "Hiring / candidate",
-                "LD-COM": "Community organization",
-                "LD-NET": "Networking contact",
-                "LD-GEN": "General lead"
-            }
-            explanations[self.lead_type] = lead_meanings.get(self.lead_type, "Unknown lead type")
+            explanations[self.lead_type] = LEAD_MEANINGS.get(self.lead_type, "Unknown lead type")
         
         if self.priority:
-            priority_meanings = {
-                "GPT-I": "Prioritize internal constraints",
-                "GPT-E": "Prioritize external constraints",
-                "GPT-F": "Prioritize founders' (Vrijen + Logan) constraints"
-            }
-            explanations[self.priority] = priority_meanings[self.priority]
+            explanations[self.priority] = PRIORITY_MEANINGS[self.priority]
         
         if self.accommodation:
-            acc_meanings = {
-                "A-0": "Only on our terms",
-                "A-1": "Baseline accommodation",
-                "A-2": "Fully accommodating"
-            }
-            explanations[self.accommodation] = acc_meanings[self.accommodation]
+            explanations[self.accommodation] = ACCOMMODATION_MEANINGS[self.accommodation]
         
         # Scheduling: LOG/ILS + generic DX, DX+, DX-
         for tag in self.scheduling:
-            if tag in {"LOG", "ILS"}:
-                sched_meanings = {
-                    "LOG": "Align with Logan's availability",
-                    "ILS": "Align with Ilse's availability",
-                }
-                explanations[tag] = sched_meanings[tag]
+            if tag in SCHEDULING_MEANINGS:
+                explanations[tag] = SCHEDULING_MEANINGS[tag]
             elif tag.startswith("D"):
                 # Parse DX/ DX+ / DX-
-                core = tag[1:]
-                suffix = None
-                if core.endswith("+") or core.endswith("-"):
-                    suffix = core[-1]
-                    core = core[:-1]
-                try:
-                    days = int(core)
-                except ValueError:
-                    explanations[tag] = f"Scheduling window: {tag}"
+                match = _SCHED_RX.fullmatch(tag)
+                if match:
+                    explanations[tag] = _SCHED_EXPLAIN[match.group(2)].format(days=int(match.group(1)))
                 else:
-                    if suffix == "+":
-                        explanations[tag] = f"Schedule {days}+ business days out (≥ {days} days)"
-                    elif suffix == "-":
-                        explanations[tag] = f"Schedule by {days} business days at latest (≤ {days} days)"
-                    else:
-                        explanations[tag] = f"Schedule in exactly {days} business days"
+                    explanations[tag] = f"Scheduling window: {tag}"
             else:
                 explanations[tag] = f"Scheduling: {tag}"
         
         # Follow-ups
         for tag in self.follow_up:
             if tag.startswith("F-"):
-                days = tag.split("-")[1]
-                explanations[tag] = f"If no reply, nudge after {days} days as Vrijen's assistant"
+                explanations[tag] = f"If no reply, nudge after {tag[2:]} days as Vrijen's assistant"
         
         # Special modifiers
         for tag in self.special:
-            special_meanings = {
-                "FLX": "Event can shift within same day",
-                "WEX": "Allow weekend extension if needed",
-                "WEP": "Prefer weekend scheduling",
-                "TERM": "Terminate Howie's involvement for this thread",
-                "INC": "Ignore email entirely"
-            }
-            explanations[tag] = special_meanings.get(tag, f"Special: {tag}")
+            explanations[tag] = SPECIAL_MEANINGS.get(tag, f"Special: {tag}")
         
         if self.activated:
             explanations["*"] = "ACTIVATED - Howie will process these tags"
         
-        return explanations
+        self._explanation = explanations
+        return dict(explanations)
 
 
 class HowieSignatureGenerator:
@@ -155,7 +186,7 @@ class HowieSignatureGenerator:
     
     # Enhanced recipient type detection with priority order
     # More specific patterns checked first
-    RECIPIENT_PATTERNS = {
+    RECIPIENT_PATTERNS: Final = {
         # Founder-related (check before generic "community")
         "founder": "LD-FND",
         "strategic founder": "LD-FND",
@@ -201,8 +232,11 @@ class HowieSignatureGenerator:
         "misc": "LD-GEN"
     }
     
+    # (pattern, lead tag) pairs, longest patterns first
+    _SORTED_PATTERNS: Final = tuple(sorted(RECIPIENT_PATTERNS.items(), key=lambda kv: -len(kv[0])))
+    
     # Legacy simple mapping for direct recipient_type parameter
-    RECIPIENT_TYPES = {
+    RECIPIENT_TYPES: Final = {
         "founder": "LD-FND",
         "investor": "LD-INV",
         "hire": "LD-HIR",
@@ -215,8 +249,18 @@ class HowieSignatureGenerator:
         "other": "LD-GEN"
     }
     
+    # Lead tag back to recipient_type, for types inferred from RECIPIENT_PATTERNS
+    LEAD_TAG_RECIPIENT_TYPES: Final = {
+        "LD-FND": "founder",
+        "LD-INV": "investor",
+        "LD-HIR": "hire",
+        "LD-COM": "community",
+        "LD-NET": "networking",
+        "LD-GEN": "general"
+    }
+    
     # Urgency now maps to DX system (no '!!')
-    URGENCY_MAPPING = {
+    URGENCY_MAPPING: Final = {
         # by 1 business day latest
         "urgent": "D1-",
         # by 3 business days latest
@@ -227,18 +271,62 @@ class HowieSignatureGenerator:
         "low": "D7+",
     }
     
-    PRIORITY_MAPPING = {
+    PRIORITY_MAPPING: Final = {
         "internal": "GPT-I",
         "external": "GPT-E",
         "founders": "GPT-F",
         "founder": "GPT-F"
     }
     
-    def __init__(self):
-        self.workspace = Path("/home/workspace")
+    # Context keywords (matched case-insensitively anywhere in the context) for
+    # urgency, priority and alignment inference
+    CONTEXT_KEYWORDS: Final = {
+        "urgent": ("urgent", "asap", "immediately", "emergency"),
+        "high": ("soon", "quickly", "this week", "early next week"),
+        "internal": ("internal", "team", "logan", "ilse"),
+        "external": ("external", "outside", "client", "customer"),
+        "logan": ("logan",),
+        "ilse": ("ilse",),
+    }
+    _KEYWORD_RX: Final = {
+        group: re.compile("|".join(map(re.escape, words)), re.IGNORECASE | re.ASCII)
+        for group, words in CONTEXT_KEYWORDS.items()
+    }
+    
+    # Pattern -> index into _SORTED_PATTERNS, and matchers over the context:
+    # a lookahead regex over all RECIPIENT_PATTERNS (so overlapping patterns are
+    # all seen; group N matches the pattern ranked N - 1) or, when pyahocorasick
+    # is installed, one automaton over the patterns and CONTEXT_KEYWORDS
+    # together, built by _compile_patterns()
+    _PATTERN_RANK: Final[Dict[str, int]] = {
+        pattern: rank for rank, (pattern, _) in enumerate(_SORTED_PATTERNS)
+    }
+    _PATTERN_RE: Final = re.compile(
+        "(?=(?:" + "|".join(f"({re.escape(pattern)})" for pattern in _PATTERN_RANK) + "))",
+        re.IGNORECASE | re.ASCII
+    )
+    _CONTEXT_AUTOMATON: ClassVar[Any] = None
+    
+    @classmethod
+    def _compile_patterns(cls) -> None:
+        """Build the context automaton (if pyahocorasick is installed)"""
+        if AHOCORASICK_AVAILABLE:
+            # word -> (pattern rank or -1, keyword groups it belongs to)
+            entries: Dict[str, Tuple[int, List[str]]] = {
+                pattern: (rank, []) for pattern, rank in cls._PATTERN_RANK.items()
+            }
+            for group, words in cls.CONTEXT_KEYWORDS.items():
+                for word in words:
+                    entries.setdefault(word, (-1, []))[1].append(group)
+            automaton = ahocorasick.Automaton()
+            for word, (rank, groups) in entries.items():
+                automaton.add_word(word, (rank, tuple(groups)))
+            automaton.make_automaton()
+            cls._CONTEXT_AUTOMATON = automaton
     
+    @classmethod
     def generate(
-        self,
+        cls,
         recipient_type: Optional[str] = None,
         urgency: Optional[str] = None,
         priority: Optional[str] = None,
@@ -259,101 +347,115 @@ class HowieSignatureGenerator:
         
         # Infer from context if provided
         if context:
-            context_lower = context.lower()
+            match, keywords = cls._scan_context(context)
             
             # Infer recipient type using pattern matching
             # Check longer patterns first (e.g., "founder partnership" before "partnership")
-            if not recipient_type:
-                sorted_patterns = sorted(
-                    self.RECIPIENT_PATTERNS.items(),
-                    key=lambda x: len(x[0]),
-                    reverse=True  # Longest patterns first
-                )
-                for pattern, lead_tag in sorted_patterns:
-                    if pattern in context_lower:
-                        # Map lead tag back to recipient_type for consistent handling
-                        recipient_type_map = {
-                            "LD-FND": "founder",
-                            "LD-INV": "investor",
-                            "LD-HIR": "hire",
-                            "LD-COM": "community",
-                            "LD-NET": "networking",
-                            "LD-GEN": "general"
-                        }
-                        recipient_type = recipient_type_map.get(lead_tag, "general")
-                        logger.info(f"Inferred recipient_type={recipient_type} from pattern '{pattern}'")
-                        break
+            if not recipient_type and match:
+                pattern, lead_tag = match
+                # Map lead tag back to recipient_type for consistent handling
+                recipient_type = cls.LEAD_TAG_RECIPIENT_TYPES.get(lead_tag, "general")
+                logger.info(f"Inferred recipient_type={recipient_type} from pattern '{pattern}'")
             
             # Infer urgency
             if not urgency:
-                if any(word in context_lower for word in ["urgent", "asap", "immediately", "emergency"]):
+                if "urgent" in keywords:
                     urgency = "urgent"
                     logger.info("Inferred urgency=urgent from context")
-                elif any(word in context_lower for word in ["soon", "quickly", "this week", "early next week"]):
+                elif "high" in keywords:
                     urgency = "high"
                     logger.info("Inferred urgency=high from context")
             
             # Infer priority
             if not priority:
-                if any(word in context_lower for word in ["internal", "team", "logan", "ilse"]):
+                if "internal" in keywords:
                     priority = "internal"
                     logger.info("Inferred priority=internal from context")
-                elif any(word in context_lower for word in ["external", "outside", "client", "customer"]):
+                elif "external" in keywords:
                     priority = "external"
                     logger.info("Inferred priority=external from context")
             
             # Infer alignment
-            if "logan" in context_lower and not align_with_logan:
+            if "logan" in keywords and not align_with_logan:
                 align_with_logan = True
                 logger.info("Inferred align_with_logan=True from context")
-            if "ilse" in context_lower and not align_with_ilse:
+            if "ilse" in keywords and not align_with_ilse:
                 align_with_ilse = True
                 logger.info("Inferred align_with_ilse=True from context")
         
         # Build tag set
         if recipient_type:
-            tags.lead_type = self.RECIPIENT_TYPES.get(recipient_type.lower())
+            tags.lead_type = cls.RECIPIENT_TYPES.get(recipient_type.lower())
         
         # Timeline / urgency
-        if urgency:
-            urgency_tag = self.URGENCY_MAPPING.get(urgency.lower())
-            if urgency_tag:
-                tags.scheduling.append(urgency_tag)
+        urgency_tag = cls.URGENCY_MAPPING.get(urgency.lower()) if urgency else None
+        scheduling = [urgency_tag] if urgency_tag else []
         
         if priority:
-            tags.priority = self.PRIORITY_MAPPING.get(priority.lower())
+            tags.priority = cls.PRIORITY_MAPPING.get(priority.lower())
         
         if accommodation is not None:
             tags.accommodation = f"A-{accommodation}"
         
         if align_with_logan:
-            tags.scheduling.append("LOG")
+            scheduling.append("LOG")
         
         if align_with_ilse:
-            tags.scheduling.append("ILS")
+            scheduling.append("ILS")
         
         if follow_up_days:
-            tags.follow_up.append(f"F-{follow_up_days}")
+            tags.follow_up = (f"F-{follow_up_days}",)
         
-        if flexible:
-            tags.special.append("FLX")
+        special = ["FLX"] if flexible else []
         
         if weekend_prefer:
-            tags.special.append("WEP")
+            special.append("WEP")
         elif weekend_ok:
-            tags.special.append("WEX")
+            special.append("WEX")
+        
+        # Default timeline if none set → D3+ (urgency is the only D-tag source)
+        if not urgency_tag:
+            scheduling.append("D3+")
         
-        # Default timeline if none set → D3+
-        if not any(t.startswith("D") for t in tags.scheduling):
-            tags.scheduling.append("D3+")
+        tags.scheduling = tuple(scheduling)
+        tags.special = tuple(special)
         
         if dry_run:
             logger.info(f"[DRY RUN] Generated tags: {tags.to_signature_line()}")
         
         return tags
     
+    @classmethod
+    def generate_batch(cls, items: Iterable[Dict[str, Any]]) -> List[HowieTagSet]:
+        """Generate tags for many contexts (each item holds generate() keyword arguments)"""
+        return [cls.generate(**item) for item in items]
+    
+    @classmethod
+    def _scan_context(cls, text: str) -> Tuple[Optional[Tuple[str, str]], Set[str]]:
+        """
+        Longest (pattern, lead tag) found in text (earlier-declared wins ties)
+        and the CONTEXT_KEYWORDS groups present
+        """
+        best = -1
+        keywords: Set[str] = set()
+        if cls._CONTEXT_AUTOMATON is not None:
+            # The automaton is case-sensitive
+            for _, (rank, groups) in cls._CONTEXT_AUTOMATON.iter(text.lower()):
+                if rank >= 0 and (best < 0 or rank < best):
+                    best = rank
+                keywords.update(groups)
+        else:
+            # ASCII-only IGNORECASE matches like lower() on ASCII text; other
+            # characters can lowercase into ASCII (e.g. "İ" -> "i̇", Kelvin
+            # sign -> "k"), so that text still gets the real mapping
+            if not text.isascii():
+                text = text.lower()
+            best = min((cast(int, m.lastindex) - 1 for m in cls._PATTERN_RE.finditer(text)), default=-1)
+            keywords.update(group for group, rx in cls._KEYWORD_RX.items() if rx.search(text))
+        return (None if best < 0 else cls._SORTED_PATTERNS[best]), keywords
+    
+    @staticmethod
     def create_full_signature(
-        self,
         tags: HowieTagSet,
         include_contact_info: bool = True,
         include_social_links: bool = True
@@ -382,7 +484,48 @@ class HowieSignatureGenerator:
         return "\n".join(lines)
 
 
-def main():
+HowieSignatureGenerator._compile_patterns()
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text, compact or 2-space indented (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _read_batch(path: str) -> List[Dict[str, Any]]:
+    """Load generate() keyword arguments, one JSON object per non-blank line"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _json_output(tags: HowieTagSet, explain: bool) -> Dict[str, Any]:
+    """JSON-ready tag line (and explanation if requested)"""
+    return {
+        "tags": tags.to_signature_line(),
+        "explanation": tags.get_explanation() if explain else None
+    }
+
+
+def _print_text(tags: HowieTagSet, full_signature: bool, explain: bool) -> None:
+    """Print the tag line or full signature, plus explanations if requested"""
+    if full_signature:
+        print(HowieSignatureGenerator.create_full_signature(tags))
+    else:
+        print(tags.to_signature_line())
+    
+    if explain:
+        print("\n--- Tag Explanations ---")
+        for tag, explanation in tags.get_explanation().items():
+            print(f"{tag}: {explanation}")
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """CLI parser (built once per process)"""
     parser = argparse.ArgumentParser(
         description="Generate Howie V-OS signature tags for emails"
     )
@@ -431,6 +574,11 @@ def main():
         "--context",
         help="Free-form context for intelligent tag inference (e.g., 'urgent investor meeting with Logan')"
     )
+    parser.add_argument(
+        "--batch",
+        help="JSONL file of generate() arguments (e.g. {\"context\": \"...\"}); "
+             "prints one result per line (one JSON object per line with --json)"
+    )
     
     # Output
     parser.add_argument("--full-signature", action="store_true", help="Generate full email signature")
@@ -438,11 +586,29 @@ def main():
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--dry-run", action="store_true", help="Preview without side effects")
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
     
-    generator = HowieSignatureGenerator()
+    if args.batch:
+        try:
+            results = HowieSignatureGenerator.generate_batch(_read_batch(args.batch))
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Invalid batch file {args.batch}: {e}")
+            return 1
+        
+        for i, tags in enumerate(results):
+            if args.json:
+                print(_json_dumps(_json_output(tags, args.explain)))
+            else:
+                if i and (args.full_signature or args.explain):
+                    print()
+                _print_text(tags, args.full_signature, args.explain)
+        return 0
     
-    tags = generator.generate(
+    tags = HowieSignatureGenerator.generate(
         recipient_type=args.recipient_type,
         urgency=args.urgency,
         priority=args.priority,
@@ -458,21 +624,9 @@ def main():
     )
     
     if args.json:
-        output = {
-            "tags": tags.to_signature_line(),
-            "explanation": tags.get_explanation() if args.explain else None
-        }
-        print(json.dumps(output, indent=2))
+        print(_json_dumps(_json_output(tags, args.explain), indent=True))
     else:
-        if args.full_signature:
-            print(generator.create_full_signature(tags))
-        else:
-            print(tags.to_signature_line())
-        
-        if args.explain:
-            print("\n--- Tag Explanations ---")
-            for tag, explanation in tags.get_explanation().items():
-                print(f"{tag}: {explanation}")
+        _print_text(tags, args.full_signature, args.explain)
     
     return 0
 
@@ -9,19 +9,127 @@ Based on: N5/docs/howie-verbal-signals.md
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+import sys
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+# Optional C automaton for the anchor prefilter (falls back to a regex scan)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional linear-time engine for scanning ASCII text pattern by pattern
+# (google-re2; other modules named re2, e.g. pyre2, lack Options)
+try:
+    import re2
+    RE2_AVAILABLE = hasattr(re2, "Options")
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional JIT-compiled engine, preferred over RE2 for ASCII text
+try:
+    import pcre2
+    PCRE2_AVAILABLE = True
+except ImportError:
+    PCRE2_AVAILABLE = False
+
+
+# Confidence levels for detected signals
+HIGH = 0.9  # Explicit, unambiguous
+MEDIUM = 0.7  # Contextual clues
+LOW = 0.5  # Vague or ambiguous
+
 
 class SignalConfidence(Enum):
-    """Confidence levels for detected signals"""
-    HIGH = 0.9  # Explicit, unambiguous
-    MEDIUM = 0.7  # Contextual clues
-    LOW = 0.5  # Vague or ambiguous
+    """Confidence levels as an enum (SIGNAL_PATTERNS uses the plain floats)"""
+    HIGH = HIGH
+    MEDIUM = MEDIUM
+    LOW = LOW
+
+
+_REPEATS = ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+_MAX_EXPANSIONS = 256
+
+
+def _expansions(items) -> Optional[Set[str]]:
+    """Every lowercase string a parsed sequence can match, or None if too many"""
+    strings = {''}
+    for op, av in items:
+        name = str(op)
+        if name == 'AT':  # Zero-width (\b, ^, $)
+            continue
+        if name == 'LITERAL':
+            options = {chr(av).lower()}
+        elif name == 'IN':
+            if any(str(kind) != 'LITERAL' for kind, _ in av):
+                return None
+            options = {chr(char).lower() for _, char in av}
+        elif name == 'SUBPATTERN':
+            options = _expansions(av[-1])
+        elif name == 'BRANCH':
+            options = set()
+            for alternative in av[1]:
+                alternative_strings = _expansions(alternative)
+                if alternative_strings is None:
+                    return None
+                options |= alternative_strings
+        elif name in _REPEATS and av[1] <= 3:
+            item_strings = _expansions(av[2])
+            if item_strings is None:
+                return None
+            options, run = set(), {''}
+            for count in range(av[1] + 1):
+                if count >= av[0]:
+                    options |= run
+                run = {a + b for a in run for b in item_strings}
+        else:
+            return None
+        if options is None:
+            return None
+        strings = {a + b for a in strings for b in options}
+        if len(strings) > _MAX_EXPANSIONS:
+            return None
+    return strings
 
 
-@dataclass
+def _anchors_cover(items, anchors: Tuple[str, ...]) -> bool:
+    """
+    Whether every match of a parsed sequence contains one of anchors
+    
+    Conservative: False when it can't tell. A run of items with few
+    expansions is covered when each expansion contains an anchor; a group,
+    alternation or required repeat is covered when its contents are.
+    """
+    items = list(items)
+    for start in range(len(items)):
+        op, av = items[start]
+        name = str(op)
+        if name == 'SUBPATTERN' and _anchors_cover(av[-1], anchors):
+            return True
+        if name == 'BRANCH' and all(_anchors_cover(alt, anchors) for alt in av[1]):
+            return True
+        if name in _REPEATS and av[0] >= 1 and _anchors_cover(av[2], anchors):
+            return True
+        # Longest expandable run starting here
+        for end in range(len(items), start, -1):
+            strings = _expansions(items[start:end])
+            if strings is not None:
+                if all(any(anchor in string for anchor in anchors) for string in strings):
+                    return True
+                break
+    return False
+
+
+@dataclass(frozen=True, slots=True)
 class DetectedSignal:
     """A detected verbal signal"""
     signal_type: str  # urgency, accommodation, priority, etc.
@@ -31,307 +139,577 @@ class DetectedSignal:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalAnalysis:
     """Complete analysis of verbal signals"""
-    signals: List[DetectedSignal] = field(default_factory=list)
+    signals: Tuple[DetectedSignal, ...] = ()
     conflicts: List[str] = field(default_factory=list)
     overall_confidence: float = 0.0
+    # by_type buckets and the signals tuple they were built from
+    _buckets: Dict[str, List[DetectedSignal]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _bucketed: Optional[Tuple[DetectedSignal, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self.signals = tuple(self.signals)
+    
+    @property
+    def by_type(self) -> Dict[str, List[DetectedSignal]]:
+        """Signals grouped by type (rebuilt only when signals is replaced)"""
+        if self._bucketed is not self.signals:
+            buckets: Dict[str, List[DetectedSignal]] = {}
+            for signal in self.signals:
+                buckets.setdefault(signal.signal_type, []).append(signal)
+            self._buckets = buckets
+            self._bucketed = self.signals
+        return self._buckets
     
     def get_signals_by_type(self, signal_type: str) -> List[DetectedSignal]:
-        """Get all signals of a specific type"""
-        return [s for s in self.signals if s.signal_type == signal_type]
+        """Get all signals of a specific type (a new list; the buckets stay intact)"""
+        return list(self.by_type.get(signal_type, ()))
     
     def get_best_signal(self, signal_type: str) -> Optional[DetectedSignal]:
         """Get highest confidence signal of a type"""
-        type_signals = self.get_signals_by_type(signal_type)
+        type_signals = self.by_type.get(signal_type)
         if not type_signals:
             return None
         return max(type_signals, key=lambda s: s.confidence)
 
 
+# Compiled scanners per (detector class, categories), see HowieVerbalSignalDetector
+_COMPILED_DETECTORS: Dict[Tuple[type, Optional[FrozenSet[str]]], Dict[str, object]] = {}
+
+
 class HowieVerbalSignalDetector:
     """Detects verbal signals for Howie tag generation"""
     
-    # Signal patterns: (pattern, signal_type, value, confidence, reasoning)
+    # Signal patterns: (pattern, signal_type, value, confidence, reasoning, anchors)
+    # anchors: lowercase literals, at least one of which every match contains.
+    # The anchors column is optional, and _compile checks it against the
+    # pattern; rows without it, or whose anchors can't be verified, are
+    # always run (so a stale anchor set costs speed, never matches)
     SIGNAL_PATTERNS = [
         # === URGENCY SIGNALS ===
         
         # High confidence urgent
         (r'\b(urgent|asap|immediately|emergency|critical|time[- ]sensitive)\b',
-         'urgency', 'urgent', SignalConfidence.HIGH,
-         'Explicit urgency language'),
+         'urgency', 'urgent', HIGH,
+         'Explicit urgency language',
+         ('urgent', 'asap', 'immediately', 'emergency', 'critical', 'sensitive')),
         
         (r'\b(this week ideally (tomorrow|next day|in the next (day|two)))\b',
-         'urgency', 'urgent', SignalConfidence.HIGH,
-         'Very tight timeline specified'),
+         'urgency', 'urgent', HIGH,
+         'Very tight timeline specified',
+         ('this week ideally',)),
         
         (r'\b(next (48 hours|two days|couple days))\b',
-         'urgency', 'urgent', SignalConfidence.HIGH,
-         'Explicit 48-hour window'),
+         'urgency', 'urgent', HIGH,
+         'Explicit 48-hour window',
+         ('48 hours', 'two days', 'couple days')),
         
         # Medium confidence high urgency
         (r'\b(this week|next few days|sooner rather than later|pressing|soon)\b',
-         'urgency', 'high', SignalConfidence.MEDIUM,
-         'Time-sensitive but not emergency'),
+         'urgency', 'high', MEDIUM,
+         'Time-sensitive but not emergency',
+         ('this week', 'next few days', 'soon', 'pressing')),
         
         (r'\b(by (end of|this) week|before friday|by friday)\b',
-         'urgency', 'high', SignalConfidence.MEDIUM,
-         'Explicit week deadline'),
+         'urgency', 'high', MEDIUM,
+         'Explicit week deadline',
+         ('week', 'friday')),
         
         # Low/normal urgency
         (r'\b(no (particular )?rush|no hurry|whenever|next week or two)\b',
-         'urgency', 'normal', SignalConfidence.HIGH,
-         'Explicit "no rush" signal'),
+         'urgency', 'normal', HIGH,
+         'Explicit "no rush" signal',
+         ('rush', 'no hurry', 'whenever', 'next week or two')),
         
         (r'\b((next|in the) (week or two|couple weeks))\b',
-         'urgency', 'normal', SignalConfidence.MEDIUM,
-         'Flexible 1-2 week window'),
+         'urgency', 'normal', MEDIUM,
+         'Flexible 1-2 week window',
+         ('week or two', 'couple weeks')),
         
         # === ACCOMMODATION SIGNALS ===
         
         # High accommodation (A-2)
         (r'\b(work around your schedule|whatever works (best )?for you|totally flexible|super flexible)\b',
-         'accommodation', 'A-2', SignalConfidence.HIGH,
-         'Explicit high accommodation language'),
+         'accommodation', 'A-2', HIGH,
+         'Explicit high accommodation language',
+         ('work around your schedule', 'whatever works', 'flexible')),
         
         (r'\b(make it work|i\'?ll make one of them (work|happen))\b',
-         'accommodation', 'A-2', SignalConfidence.MEDIUM,
-         'Commitment to accommodate'),
+         'accommodation', 'A-2', MEDIUM,
+         'Commitment to accommodate',
+         ('make it work', 'make one of them')),
         
         # Balanced accommodation (A-1)
         (r'\b(let me know (what|some times) (that work|works for you))\b',
-         'accommodation', 'A-1', SignalConfidence.MEDIUM,
-         'Requesting their availability'),
+         'accommodation', 'A-1', MEDIUM,
+         'Requesting their availability',
+         ('let me know',)),
         
         (r'\b(send (me|you) some (times|options))\b',
-         'accommodation', 'A-1', SignalConfidence.MEDIUM,
-         'Proposing times'),
+         'accommodation', 'A-1', MEDIUM,
+         'Proposing times',
+         ('some times', 'some options')),
         
         (r'\b(i\'?ll (send|propose) )\b',
-         'accommodation_proactive', 'propose_times', SignalConfidence.MEDIUM,
-         'Proactive scheduling (Howie proposes)'),
+         'accommodation_proactive', 'propose_times', MEDIUM,
+         'Proactive scheduling (Howie proposes)',
+         ('ll send', 'll propose')),
         
         (r'\b(my assistant will (reach out|send|contact))\b',
-         'accommodation_proactive', 'propose_times', SignalConfidence.HIGH,
-         'Assistant will propose times'),
+         'accommodation_proactive', 'propose_times', HIGH,
+         'Assistant will propose times',
+         ('my assistant will',)),
         
         # Minimal accommodation (A-0)
         (r'\b(on our terms|when (it works|we\'?re available) for us|if we have availability)\b',
-         'accommodation', 'A-0', SignalConfidence.HIGH,
-         'Minimal accommodation, our convenience only'),
+         'accommodation', 'A-0', HIGH,
+         'Minimal accommodation, our convenience only',
+         ('on our terms', 'for us', 'if we have availability')),
         
         (r'\b(i\'?ll check (my|our) calendar and let you know)\b',
-         'accommodation', 'A-0', SignalConfidence.MEDIUM,
-         'Internal-first scheduling'),
+         'accommodation', 'A-0', MEDIUM,
+         'Internal-first scheduling',
+         ('calendar and let you know',)),
         
         # === PRIORITY SIGNALS ===
         
         # External priority (GPT-E)
         (r'\b(what does your schedule look like|what times (are )?good for you)\b',
-         'priority', 'GPT-E', SignalConfidence.HIGH,
-         'Deferring to external preferences'),
+         'priority', 'GPT-E', HIGH,
+         'Deferring to external preferences',
+         ('what does your schedule look like', 'what times')),
         
         (r'\b(work around your|accommodate you|your convenience)\b',
-         'priority', 'GPT-E', SignalConfidence.HIGH,
-         'Prioritizing external stakeholder'),
+         'priority', 'GPT-E', HIGH,
+         'Prioritizing external stakeholder',
+         ('work around your', 'accommodate you', 'your convenience')),
         
         # Founders priority (GPT-F)
         (r'\b(both (of us|founders)|founders should|the founders)\b',
-         'priority', 'GPT-F', SignalConfidence.HIGH,
-         'Both founders mentioned'),
+         'priority', 'GPT-F', HIGH,
+         'Both founders mentioned',
+         ('both of us', 'founders')),
         
         # Internal priority (GPT-I)
         (r'\b((when|if) (it works|we have time) for us)\b',
-         'priority', 'GPT-I', SignalConfidence.HIGH,
-         'Internal-first priority'),
+         'priority', 'GPT-I', HIGH,
+         'Internal-first priority',
+         ('for us',)),
         
         # === ALIGNMENT SIGNALS ===
         
         # Logan
         (r'\b(logan should (join|be (there|on|included)))\b',
-         'alignment', 'LOG', SignalConfidence.HIGH,
-         'Explicit Logan inclusion'),
+         'alignment', 'LOG', HIGH,
+         'Explicit Logan inclusion',
+         ('logan should',)),
         
         (r'\b(get logan (on|involved)|see when logan is free|check with logan)\b',
-         'alignment', 'LOG', SignalConfidence.HIGH,
-         'Need Logan availability'),
+         'alignment', 'LOG', HIGH,
+         'Need Logan availability',
+         ('logan',)),
         
         (r'\blogan\b(?! ?@)',  # "logan" but not "logan@email"
-         'alignment', 'LOG', SignalConfidence.MEDIUM,
-         'Logan mentioned in scheduling context'),
+         'alignment', 'LOG', MEDIUM,
+         'Logan mentioned in scheduling context',
+         ('logan',)),
         
         # Ilias
         (r'\b(ilias should (join|be (there|on|included)))\b',
-         'alignment', 'ILS', SignalConfidence.HIGH,
-         'Explicit Ilias inclusion'),
+         'alignment', 'ILS', HIGH,
+         'Explicit Ilias inclusion',
+         ('ilias should',)),
         
         (r'\b(check with ilias|see when ilias is free)\b',
-         'alignment', 'ILS', SignalConfidence.HIGH,
-         'Need Ilias availability'),
+         'alignment', 'ILS', HIGH,
+         'Need Ilias availability',
+         ('ilias',)),
         
         # === STAKEHOLDER TYPE SIGNALS ===
         
         # Investor (LD-INV)
         (r'\b(investor|funding|fundraising|our (seed|series|round)|raise|pitch deck)\b',
-         'stakeholder_type', 'investor', SignalConfidence.HIGH,
-         'Investor-related language'),
+         'stakeholder_type', 'investor', HIGH,
+         'Investor-related language',
+         ('investor', 'funding', 'fundraising', 'our seed', 'our series', 'our round', 'raise', 'pitch deck')),
         
         (r'\b(vc|venture capital|investment opportunity)\b',
-         'stakeholder_type', 'investor', SignalConfidence.HIGH,
-         'Investor/VC context'),
+         'stakeholder_type', 'investor', HIGH,
+         'Investor/VC context',
+         ('vc', 'venture capital', 'investment opportunity')),
         
         # Hiring (LD-HIR)
         (r'\b(interview|candidate|role|position|hire|hiring|job)\b',
-         'stakeholder_type', 'hire', SignalConfidence.MEDIUM,
-         'Hiring/recruiting context'),
+         'stakeholder_type', 'hire', MEDIUM,
+         'Hiring/recruiting context',
+         ('interview', 'candidate', 'role', 'position', 'hire', 'hiring', 'job')),
         
         (r'\b(technical co-founder search|looking for (a )?co-founder)\b',
-         'stakeholder_type', 'hire', SignalConfidence.HIGH,
-         'Co-founder search'),
+         'stakeholder_type', 'hire', HIGH,
+         'Co-founder search',
+         ('co-founder',)),
         
         # Community (LD-COM)
         (r'\b((let\'?s )?explore (a )?partnership|collaboration opportunity|work together)\b',
-         'stakeholder_type', 'community', SignalConfidence.HIGH,
-         'Partnership/collaboration language'),
+         'stakeholder_type', 'community', HIGH,
+         'Partnership/collaboration language',
+         ('explore', 'collaboration opportunity', 'work together')),
         
         (r'\b(ecosystem|community|founder|startup community)\b',
-         'stakeholder_type', 'community', SignalConfidence.MEDIUM,
-         'Community/ecosystem context'),
+         'stakeholder_type', 'community', MEDIUM,
+         'Community/ecosystem context',
+         ('ecosystem', 'community', 'founder')),
         
         # Networking (LD-NET)
         (r'\b(pick your brain|get your (thoughts|feedback|perspective)|would love your (input|advice))\b',
-         'stakeholder_type', 'networking', SignalConfidence.HIGH,
-         'Advisory/networking language'),
+         'stakeholder_type', 'networking', HIGH,
+         'Advisory/networking language',
+         ('pick your brain', 'get your', 'would love your')),
         
         (r'\b(coffee chat|quick chat|informational)\b',
-         'stakeholder_type', 'networking', SignalConfidence.MEDIUM,
-         'Casual networking context'),
+         'stakeholder_type', 'networking', MEDIUM,
+         'Casual networking context',
+         ('coffee chat', 'quick chat', 'informational')),
         
         # === FOLLOW-UP SIGNALS ===
         
         # Explicit follow-up with timeline
         (r'\b(i\'?ll follow up in (\d+) days?)\b',
-         'follow_up', 'F-\\2', SignalConfidence.HIGH,
-         'Explicit follow-up timeline'),
+         'follow_up', 'F-\\2', HIGH,
+         'Explicit follow-up timeline',
+         ('ll follow up in',)),
         
         (r'\b(if (i|we) don\'?t hear back (by|in) (\d+) days?)\b',
-         'follow_up', 'F-\\4', SignalConfidence.HIGH,
-         'Conditional follow-up with timeline'),
+         'follow_up', 'F-\\4', HIGH,
+         'Conditional follow-up with timeline',
+         ('hear back',)),
         
         (r'\b(i\'?ll (check back|reconnect) (next week|in a week))\b',
-         'follow_up', 'F-7', SignalConfidence.MEDIUM,
-         '"Next week" follow-up'),
+         'follow_up', 'F-7', MEDIUM,
+         '"Next week" follow-up',
+         ('check back', 'reconnect')),
         
         (r'\b(i\'?ll ping you again|follow up again|circle back)\b',
-         'follow_up', 'follow_up_needed', SignalConfidence.MEDIUM,
-         'Follow-up needed (timeline unclear)'),
+         'follow_up', 'follow_up_needed', MEDIUM,
+         'Follow-up needed (timeline unclear)',
+         ('ll ping you again', 'follow up again', 'circle back')),
         
         # === FLEXIBILITY SIGNALS ===
         
         # Same-day flexibility (FLX)
         (r'\b(totally flexible|anytime that day|morning or afternoon both work|super flexible)\b',
-         'flexibility', 'FLX', SignalConfidence.HIGH,
-         'Explicit same-day flexibility'),
+         'flexibility', 'FLX', HIGH,
+         'Explicit same-day flexibility',
+         ('flexible', 'anytime that day', 'morning or afternoon both work')),
         
         # Weekend signals
         (r'\b(weekend works|saturday (or )?sunday (could work|works))\b',
-         'flexibility', 'WEX', SignalConfidence.HIGH,
-         'Weekend acceptable'),
+         'flexibility', 'WEX', HIGH,
+         'Weekend acceptable',
+         ('weekend works', 'saturday')),
         
         (r'\b(prefer (a )?weekend|weekends are (actually )?easier)\b',
-         'flexibility', 'WEP', SignalConfidence.HIGH,
-         'Weekend preferred'),
+         'flexibility', 'WEP', HIGH,
+         'Weekend preferred',
+         ('prefer', 'weekends are')),
         
         # === TERMINATION SIGNALS ===
         
         # Terminate (TERM)
         (r'\b(put (a )?pin in this|not the right time|let\'?s revisit|put this on hold)\b',
-         'termination', 'TERM', SignalConfidence.HIGH,
-         'Explicit termination of scheduling'),
+         'termination', 'TERM', HIGH,
+         'Explicit termination of scheduling',
+         ('pin in this', 'not the right time', 'revisit', 'put this on hold')),
         
         (r'\b(let\'?s reconnect in (a few months|q\d))\b',
-         'termination', 'TERM', SignalConfidence.HIGH,
-         'Long-term deferral'),
+         'termination', 'TERM', HIGH,
+         'Long-term deferral',
+         ('reconnect in',)),
         
         # Ignore (INC)
         (r'\b((doesn\'?t|don\'?t) need a meeting|handle (this|it) over email|no need to meet)\b',
-         'termination', 'INC', SignalConfidence.HIGH,
-         'Meeting not necessary'),
+         'termination', 'INC', HIGH,
+         'Meeting not necessary',
+         ('t need a meeting', 'over email', 'no need to meet')),
         
         # === CRM PREFERENCE SIGNALS ===
         
         # Store preference
         (r'\b(make a note that (they|he|she) prefer[s]?)\b',
-         'crm_action', 'store_preference', SignalConfidence.HIGH,
-         'Explicit preference storage request'),
+         'crm_action', 'store_preference', HIGH,
+         'Explicit preference storage request',
+         ('make a note that',)),
         
         (r'\b(they\'?re in (.+) time)\b',
-         'crm_action', 'store_timezone', SignalConfidence.HIGH,
-         'Timezone information'),
+         'crm_action', 'store_timezone', HIGH,
+         'Timezone information',
+         ('re in',)),
         
         (r'\b(flag this as (a )?(warm|hot|high[- ]priority) (lead|relationship))\b',
-         'crm_action', 'update_relationship_stage', SignalConfidence.HIGH,
-         'Relationship classification'),
+         'crm_action', 'update_relationship_stage', HIGH,
+         'Relationship classification',
+         ('flag this as',)),
     ]
     
-    def __init__(self):
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), sig_type, value, conf, reason)
-            for pattern, sig_type, value, conf, reason in self.SIGNAL_PATTERNS
+    # Stakeholder type value -> lead tag (anything else is LD-GEN)
+    STAKEHOLDER_TAGS = {
+        'investor': 'LD-INV',
+        'hire': 'LD-HIR',
+        'community': 'LD-COM',
+        'networking': 'LD-NET'
+    }
+    
+    # Analyses kept for repeated texts (oldest evicted first)
+    CACHE_SIZE = 4096
+    
+    # Below this length re's lower per-call overhead beats RE2's faster scan
+    RE2_MIN_LENGTH = 256
+    
+    def __init__(self, categories: Optional[Iterable[str]] = None,
+                 stop_on_termination: bool = False):
+        """
+        Args:
+            categories: Signal types to detect (e.g. {'urgency', 'priority'});
+                all of them when None
+            stop_on_termination: When a high-confidence termination signal
+                is found, skip the other patterns and report only the
+                termination signals (the recommended tags are the same, but
+                confidence, conflicts and CRM actions then ignore the rest)
+        """
+        self.stop_on_termination = stop_on_termination
+        self._cache: "OrderedDict[str, Tuple[Tuple[DetectedSignal, ...], Tuple[str, ...], float]]" = OrderedDict()
+        # Compiled on first use and shared by every detector of the class with
+        # the same categories (a subclass with its own SIGNAL_PATTERNS
+        # compiles its own)
+        key = (type(self), None if categories is None else frozenset(categories))
+        compiled = _COMPILED_DETECTORS.get(key)
+        if compiled is None:
+            patterns = self.SIGNAL_PATTERNS
+            if key[1] is not None:
+                unknown = key[1] - {row[1] for row in patterns}
+                if unknown:
+                    raise ValueError(f"Unknown signal categories: {sorted(unknown)}")
+                if not key[1]:
+                    raise ValueError("categories must name at least one signal type")
+                patterns = [row for row in patterns if row[1] in key[1]]
+            compiled = _COMPILED_DETECTORS[key] = self._compile(patterns)
+        vars(self).update(compiled)
+    
+    def _compile(self, patterns: List[Tuple]) -> Dict[str, object]:
+        """Compile SIGNAL_PATTERNS rows and build the scanners over them"""
+        # Type/value are interned (the conflict and recommendation checks
+        # compare them); the last field flags values with group references
+        # (the F-X patterns)
+        compiled_patterns = [
+            (re.compile(pattern, re.IGNORECASE), sys.intern(sig_type), sys.intern(value),
+             conf, reason, '\\' in value)
+            for pattern, sig_type, value, conf, reason, *_ in patterns
         ]
+        # Prefilter anchors per row, kept only where every match must contain one
+        row_anchors = [
+            row[5] if len(row) > 5 and row[5] and _anchors_cover(
+                sre_parse.parse(row[0], re.IGNORECASE), row[5]
+            ) else ()
+            for row in patterns
+        ]
+        # Zero-width scan over every pattern at once: it stops at each position
+        # where some pattern matches, and group g<i> names the first one that
+        # does (every pattern starts at a word boundary before a word character)
+        combined = r'\b(?=\w)(?=(?:' + '|'.join(
+            f'(?P<g{i}>{pattern})' for i, (pattern, *_) in enumerate(patterns)
+        ) + '))'
+        # Anchor -> indices of the patterns it can start; patterns with no
+        # anchors are always candidates
+        anchor_automaton = None
+        if AHOCORASICK_AVAILABLE and any(row_anchors):
+            anchor_patterns: Dict[str, List[int]] = {}
+            for i, anchors in enumerate(row_anchors):
+                for anchor in anchors:
+                    anchor_patterns.setdefault(anchor, []).append(i)
+            anchor_automaton = ahocorasick.Automaton()
+            for anchor, indices in anchor_patterns.items():
+                anchor_automaton.add_word(anchor, indices)
+            anchor_automaton.make_automaton()
+        # Per pattern scanner for ASCII text, where PCRE2's and RE2's \b, \w
+        # and case folding agree with re's: PCRE2 (JIT) for every pattern, or
+        # RE2 where it can compile the pattern (it has no lookaround) and re
+        # otherwise
+        ascii_scanners: List = []
+        ascii_min_length = 0
+        if PCRE2_AVAILABLE:
+            ascii_scanners = [pcre2.compile(pattern, pcre2.IGNORECASE) for pattern, *_ in patterns]
+        elif RE2_AVAILABLE:
+            ascii_scanners = [compiled for compiled, *_ in compiled_patterns]
+            options = re2.Options()
+            options.case_sensitive = False
+            options.log_errors = False
+            for i, (pattern, *_) in enumerate(patterns):
+                try:
+                    ascii_scanners[i] = re2.compile(pattern, options)
+                except re2.error:
+                    pass
+            ascii_min_length = self.RE2_MIN_LENGTH
+        return {
+            'compiled_patterns': compiled_patterns,
+            'combined_pattern': re.compile(combined, re.IGNORECASE),
+            # Case-sensitive twins for lowercased ASCII text (the pattern
+            # sources are all lowercase)
+            'lower_patterns': [re.compile(pattern) for pattern, *_ in patterns],
+            'lower_combined_pattern': re.compile(combined),
+            'anchor_automaton': anchor_automaton,
+            'unanchored': [i for i, anchors in enumerate(row_anchors) if not anchors],
+            'termination_indices': [
+                i for i, row in enumerate(patterns)
+                if row[1] == 'termination' and row[3] >= HIGH
+            ],
+            'ascii_scanners': ascii_scanners,
+            'ascii_min_length': ascii_min_length,
+        }
+    
+    def _find_matches(self, text: str) -> List[List[re.Match]]:
+        """Per pattern, the same matches its own finditer() would return"""
+        compiled = self.compiled_patterns
+        matches: List[List[re.Match]] = [[] for _ in compiled]
+        
+        # IGNORECASE folds some non-ASCII letters onto ASCII ones (e.g. "ſ"),
+        # so only the IGNORECASE scan is exact on non-ASCII text
+        if not text.isascii():
+            return self._scan_combined(text, text, self.combined_pattern, matches)
+        
+        # On ASCII text, case-sensitive patterns over the lowercased text
+        # match exactly where the IGNORECASE ones would, with less work
+        low = text.lower()
+        use_ascii_scanners = bool(self.ascii_scanners) and len(text) >= self.ascii_min_length
+        if self.anchor_automaton is None and not use_ascii_scanners:
+            return self._scan_combined(text, low, self.lower_combined_pattern, matches)
+        
+        # Only run patterns whose anchors occur
+        if self.anchor_automaton is not None:
+            candidates = set(self.unanchored)
+            for _, indices in self.anchor_automaton.iter(low):
+                candidates.update(indices)
+        else:
+            candidates = range(len(compiled))
+        for i in candidates:
+            if use_ascii_scanners:
+                matches[i] = list(self.ascii_scanners[i].finditer(text))
+            else:
+                # Rematch hits on the original text for its case in groups
+                matches[i] = [
+                    compiled[i][0].match(text, hit.start())
+                    for hit in self.lower_patterns[i].finditer(low)
+                ]
+        return matches
+    
+    def _scan_combined(self, text: str, subject: str, combined: re.Pattern,
+                       matches: List[List[re.Match]]) -> List[List[re.Match]]:
+        """Fill matches from a combined scan of subject (text or its lowercase)"""
+        compiled = self.compiled_patterns
+        patterns = self.lower_patterns if subject is not text else [row[0] for row in compiled]
+        ends = [0] * len(compiled)
+        for candidate in combined.finditer(subject):
+            pos = candidate.start()
+            # Patterns before the first matching alternative can't match here;
+            # later ones might, so confirm each (unless inside its last match)
+            for i in range(int(candidate.lastgroup[1:]), len(compiled)):
+                if pos >= ends[i]:
+                    match = patterns[i].match(subject, pos)
+                    if match:
+                        if subject is not text:
+                            match = compiled[i][0].match(text, pos)
+                        matches[i].append(match)
+                        ends[i] = match.end()
+        return matches
     
     def analyze_text(self, text: str) -> SignalAnalysis:
         """Analyze text for verbal signals"""
-        analysis = SignalAnalysis()
-        
-        # Detect all signals
-        for pattern, sig_type, value, confidence, reasoning in self.compiled_patterns:
-            matches = pattern.finditer(text)
-            for match in matches:
-                # Interpolate captured groups into value (for F-X patterns)
-                interpolated_value = value
-                for i, group in enumerate(match.groups(), 1):
-                    if group:
-                        interpolated_value = interpolated_value.replace(f'\\{i}', group)
-                
-                signal = DetectedSignal(
-                    signal_type=sig_type,
-                    value=interpolated_value,
-                    confidence=confidence.value,
-                    matched_phrase=match.group(0),
-                    reasoning=reasoning
-                )
-                analysis.signals.append(signal)
+        cached = self._cache.get(text)
+        if cached is None:
+            analysis = self._analyze(text)
+            cached = (analysis.signals, tuple(analysis.conflicts), analysis.overall_confidence)
+            self._cache[text] = cached
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        # Fresh conflicts list each call so callers can't alter the cached result
+        signals, conflicts, overall_confidence = cached
+        return SignalAnalysis(signals, list(conflicts), overall_confidence)
+    
+    def analyze_batch(self, texts: Iterable[str]) -> List[SignalAnalysis]:
+        """Analyze many texts (repeats are served from the result cache)"""
+        return [self.analyze_text(text) for text in texts]
+    
+    def _analyze(self, text: str) -> SignalAnalysis:
+        """Run every pattern over text and build its analysis"""
+        
+        # Termination overrides every other tag, so when asked, try those
+        # patterns alone first
+        pattern_matches = None
+        if self.stop_on_termination:
+            pattern_matches = [[] for _ in self.compiled_patterns]
+            for i in self.termination_indices:
+                pattern_matches[i] = list(self.compiled_patterns[i][0].finditer(text))
+            if not any(pattern_matches):
+                pattern_matches = None
+        if pattern_matches is None:
+            pattern_matches = self._find_matches(text)
+        
+        # Detect all signals (one scan, then grouped in pattern order)
+        signals: List[DetectedSignal] = []
+        seen: Dict[str, Set[str]] = {}  # signal type -> values emitted
+        for (pattern, sig_type, value, confidence, reasoning, needs_interp), matches in zip(
+            self.compiled_patterns, pattern_matches
+        ):
+            if not matches:
+                continue
+            if needs_interp:
+                # Interpolate captured groups into value (for F-X patterns;
+                # the groups they reference always participate)
+                found = [
+                    DetectedSignal(sig_type, sys.intern(match.expand(value)), confidence,
+                                   match.group(0), reasoning)
+                    for match in matches
+                ]
+                seen.setdefault(sig_type, set()).update(s.value for s in found)
+            else:
+                found = [
+                    DetectedSignal(sig_type, value, confidence, match.group(0), reasoning)
+                    for match in matches
+                ]
+                seen.setdefault(sig_type, set()).add(value)
+            signals.extend(found)
         
         # Detect conflicts
-        analysis.conflicts = self._detect_conflicts(analysis.signals)
+        conflicts = self._detect_conflicts(seen)
         
         # Calculate overall confidence
-        if analysis.signals:
-            analysis.overall_confidence = sum(s.confidence for s in analysis.signals) / len(analysis.signals)
+        overall_confidence = 0.0
+        if signals:
+            overall_confidence = sum(s.confidence for s in signals) / len(signals)
         
-        return analysis
+        return SignalAnalysis(tuple(signals), conflicts, overall_confidence)
     
-    def _detect_conflicts(self, signals: List[DetectedSignal]) -> List[str]:
-        """Detect conflicting signals"""
+    def _detect_conflicts(self, seen: Dict[str, Set[str]]) -> List[str]:
+        """Detect conflicting signals (seen maps each signal type to its values)"""
         conflicts = []
         
         # Check urgency conflicts
-        urgency_signals = [s for s in signals if s.signal_type == 'urgency']
-        urgency_values = set(s.value for s in urgency_signals)
+        urgency_values = seen.get('urgency', ())
         if 'urgent' in urgency_values and 'normal' in urgency_values:
             conflicts.append("CONFLICT: Both 'urgent' and 'no rush' detected")
         
         # Check accommodation conflicts
-        acc_signals = [s for s in signals if s.signal_type == 'accommodation']
-        acc_values = set(s.value for s in acc_signals)
+        acc_values = seen.get('accommodation', ())
         if 'A-0' in acc_values and 'A-2' in acc_values:
             conflicts.append("CONFLICT: Both 'on our terms' and 'work around their schedule' detected")
         
         # Check priority conflicts
-        pri_signals = [s for s in signals if s.signal_type == 'priority']
-        pri_values = set(s.value for s in pri_signals)
+        pri_values = seen.get('priority', ())
         if 'GPT-I' in pri_values and 'GPT-E' in pri_values:
             conflicts.append("CONFLICT: Both 'internal priority' and 'external priority' detected")
         
@@ -346,9 +724,12 @@ class HowieVerbalSignalDetector:
             'conflicts': analysis.conflicts,
             'crm_actions': []
         }
+        by_type = analysis.by_type
+        # Highest confidence signal of each type (first one wins ties)
+        best = {t: max(signals, key=lambda s: s.confidence) for t, signals in by_type.items()}
         
         # Urgency
-        urgency_signal = analysis.get_best_signal('urgency')
+        urgency_signal = best.get('urgency')
         if urgency_signal:
             if urgency_signal.value == 'urgent':
                 recommendations['tags'].append('!!')
@@ -361,58 +742,52 @@ class HowieVerbalSignalDetector:
                 recommendations['reasoning'].append(f"Normal timeline: {urgency_signal.matched_phrase}")
         
         # Stakeholder type
-        stakeholder_signal = analysis.get_best_signal('stakeholder_type')
+        stakeholder_signal = best.get('stakeholder_type')
         if stakeholder_signal:
-            type_map = {
-                'investor': 'LD-INV',
-                'hire': 'LD-HIR',
-                'community': 'LD-COM',
-                'networking': 'LD-NET'
-            }
-            tag = type_map.get(stakeholder_signal.value, 'LD-GEN')
+            tag = self.STAKEHOLDER_TAGS.get(stakeholder_signal.value, 'LD-GEN')
             recommendations['tags'].append(tag)
             recommendations['reasoning'].append(f"Type: {stakeholder_signal.matched_phrase}")
         
         # Priority
-        priority_signal = analysis.get_best_signal('priority')
+        priority_signal = best.get('priority')
         if priority_signal:
             recommendations['tags'].append(priority_signal.value)
             recommendations['reasoning'].append(f"Priority: {priority_signal.matched_phrase}")
         
         # Accommodation
-        acc_signal = analysis.get_best_signal('accommodation')
+        acc_signal = best.get('accommodation')
         if acc_signal:
             recommendations['tags'].append(acc_signal.value)
             recommendations['reasoning'].append(f"Accommodation: {acc_signal.matched_phrase}")
         
         # Alignment
-        alignment_signals = analysis.get_signals_by_type('alignment')
+        alignment_signals = by_type.get('alignment', [])
         for sig in alignment_signals:
             if sig.value not in recommendations['tags']:
                 recommendations['tags'].append(sig.value)
                 recommendations['reasoning'].append(f"Align with: {sig.matched_phrase}")
         
         # Follow-up
-        followup_signal = analysis.get_best_signal('follow_up')
+        followup_signal = best.get('follow_up')
         if followup_signal and followup_signal.value.startswith('F-'):
             recommendations['tags'].append(followup_signal.value)
             recommendations['reasoning'].append(f"Follow-up: {followup_signal.matched_phrase}")
         
         # Flexibility
-        flex_signals = analysis.get_signals_by_type('flexibility')
+        flex_signals = by_type.get('flexibility', [])
         for sig in flex_signals:
             if sig.value not in recommendations['tags']:
                 recommendations['tags'].append(sig.value)
                 recommendations['reasoning'].append(f"Flexibility: {sig.matched_phrase}")
         
         # Termination
-        term_signal = analysis.get_best_signal('termination')
+        term_signal = best.get('termination')
         if term_signal:
             recommendations['tags'] = [term_signal.value]  # Override all other tags
             recommendations['reasoning'] = [f"Termination: {term_signal.matched_phrase}"]
         
         # CRM actions
-        crm_signals = analysis.get_signals_by_type('crm_action')
+        crm_signals = by_type.get('crm_action', [])
         for sig in crm_signals:
             recommendations['crm_actions'].append({
                 'action': sig.value,
@@ -436,6 +811,9 @@ def main():
     parser.add_argument('--text', help="Text to analyze")
     parser.add_argument('--file', help="File containing text to analyze")
     parser.add_argument('--output-format', choices=['text', 'json'], default='text')
+    parser.add_argument('--categories', help="Comma-separated signal types to detect (default: all)")
+    parser.add_argument('--stop-on-termination', action='store_true',
+                        help="Report only termination signals when one is found")
     
     args = parser.parse_args()
     
@@ -448,7 +826,10 @@ def main():
         # Example text
         text = "This is urgent - we need to meet this week. Logan should join, and I'm happy to work around your schedule."
     
-    detector = HowieVerbalSignalDetector()
+    detector = HowieVerbalSignalDetector(
+        args.categories.split(',') if args.categories else None,
+        stop_on_termination=args.stop_on_termination
+    )
     analysis = detector.analyze_text(text)
     recommendations = detector.generate_recommendations(analysis)
     